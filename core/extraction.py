@@ -1,16 +1,500 @@
+import atexit
+import ctypes
+import logging
+import numpy as np
 import pandas as pd
+import openpyxl
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_float_dtype,
+    is_numeric_dtype,
+)
 import os
 import glob
+import shutil
+import sys
+import tempfile
+import threading
+import zipfile
+from xml.etree import ElementTree
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Final,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
 
 from models.data_models import (
     FunnelData,
+    FunnelDataColumnar,
     FunnelEntry,
     ExcelFileMetadata,
-    ExcelSheetMetadata,
+    ExcelFileMetadataTD,
+    ExcelSheetMetadataTD,
+    ProbabilityStatusT,
 )
 from utils.logging_utils import ContextLogger
+from utils.metadata_cache import cache_key, metadata_cache
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+try:
+    import python_calamine
+
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+# File extensions openpyxl can open; anything else goes through pandas
+_OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm")
+
+# File extensions parsed with the calamine engine when it is installed
+_CALAMINE_EXTENSIONS = (".xlsx", ".xlsm", ".xlsb", ".xls", ".ods")
+
+# Default mapping of Excel column names to FunnelEntry field names
+_DEFAULT_MAPPING: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "Company": "company_name",
+        "Project": "project_name",
+        "Value": "value",
+        "Probability (%)": "probability",
+        "Status": "status",
+        "Start Date": "start_date",
+        "Expected Close": "expected_close_date",
+        "Notes": "notes",
+        "Last Updated": "last_updated",
+    }
+)
+_DEFAULT_MAPPING_KEYS: Final[FrozenSet[str]] = frozenset(_DEFAULT_MAPPING)
+
+# Run the full Pydantic validation for every extracted row. When False, rows
+# that pass the vectorized column checks are built with model_construct and only
+# the first row is validated to catch schema drift.
+EXTRACTION_VALIDATE = False
+
+# Column dtypes applied while reading sheets laid out like the default mapping.
+# Numeric columns are left to inference, since forcing float64 would fail the
+# whole read on a single bad cell instead of reporting it as a row error. Date
+# columns need no parse_dates because both engines return typed datetimes.
+_DEFAULT_DTYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {"Company": "string", "Project": "string", "Notes": "string"}
+)
+
+# FunnelEntry fields that must be present in every row
+_REQUIRED_FIELDS = ("company_name", "project_name", "value")
+
+# Target dtypes of the FunnelEntry fields coerced column-wise before the rows
+# are turned into entries, so Pydantic sees values of the final type
+_FIELD_DTYPES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "id": "string",
+        "company_name": "string",
+        "project_name": "string",
+        "notes": "string",
+        "value": "float64",
+        "probability": "float64",
+        "start_date": "datetime64[ns]",
+        "expected_close_date": "datetime64[ns]",
+        "last_updated": "datetime64[ns]",
+    }
+)
+_STATUS_VALUES: Final[FrozenSet[str]] = frozenset(get_args(ProbabilityStatusT))
+# Worded like the Pydantic error for the Literal
+*_other_statuses, _last_status = map(repr, get_args(ProbabilityStatusT))
+_STATUS_ERROR = (
+    f"status: Input should be {', '.join(_other_statuses)} or {_last_status}"
+)
+
+# Mapping targets with this prefix are collected into FunnelEntry.custom_fields
+_CUSTOM_FIELDS_PREFIX = "custom_fields."
+
+# Number of row errors included in the aggregated validation log record
+_MAX_LOGGED_ERRORS = 10
+
+# GetDriveTypeW result for network drives
+_DRIVE_REMOTE = 4
+
+# Local copies of network files that have not been released yet, removed at
+# exit if their extractor was never closed
+_local_copies: Set[str] = set()
+_local_copies_lock = threading.Lock()
+
+
+def _read_workbook_sheet_names(file_path: str) -> Optional[List[str]]:
+    """
+    Read sheet names straight from the xl/workbook.xml part of an xlsx archive.
+
+    Only the workbook part is parsed, so the cost does not depend on the amount
+    of data in the sheets.
+
+    Returns:
+        List of sheet names, or None if the file is not a zip archive with an
+        XML workbook part (e.g. legacy .xls or binary .xlsb files) or a sheet
+        has no name, leaving it to the full parser
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open("xl/workbook.xml") as workbook_xml:
+                # Match on the local tag name so both transitional and strict
+                # OOXML namespaces are handled
+                return [
+                    element.attrib["name"]
+                    for _, element in ElementTree.iterparse(workbook_xml)
+                    if element.tag.endswith("}sheet")
+                ]
+    except (zipfile.BadZipFile, KeyError):
+        return None
+
+
+def _is_network_path(file_path: str) -> bool:
+    """
+    Check whether a path points to a network share.
+
+    UNC paths always do; on Windows, mapped drive letters are checked with
+    GetDriveTypeW.
+    """
+    if file_path.startswith(("\\\\", "//")):
+        return True
+    drive = os.path.splitdrive(os.path.abspath(file_path))[0]
+    return bool(drive) and _is_remote_drive(drive)
+
+
+@lru_cache(maxsize=None)
+def _is_remote_drive(drive: str) -> bool:
+    """Check whether a Windows drive letter is mapped to a network share."""
+    if sys.platform != "win32":
+        return False
+    return ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\") == _DRIVE_REMOTE
+
+
+def _local_copy(file_path: str) -> str:
+    """
+    Copy a file to a new local temporary file.
+
+    The source is read once sequentially instead of through the many random
+    reads the Excel parsers make. The copy is made outside any lock, so a slow
+    copy does not hold up reads of other files.
+
+    Args:
+        file_path: Path of the source file
+
+    Returns:
+        Path of the local copy, to be released with _remove_local_copy
+    """
+    fd, local_path = tempfile.mkstemp(suffix=os.path.splitext(file_path)[1])
+    os.close(fd)
+    try:
+        shutil.copyfile(file_path, local_path)
+    except BaseException:
+        os.remove(local_path)
+        raise
+
+    with _local_copies_lock:
+        _local_copies.add(local_path)
+    return local_path
+
+
+def _remove_local_copy(local_path: str) -> None:
+    """Delete a local copy, ignoring files that are already gone."""
+    with _local_copies_lock:
+        _local_copies.discard(local_path)
+    try:
+        os.remove(local_path)
+    except OSError:
+        pass
+
+
+@atexit.register
+def _remove_local_copies() -> None:
+    """Delete every local copy of this process that was not released."""
+    with _local_copies_lock:
+        local_paths = list(_local_copies)
+    for local_path in local_paths:
+        _remove_local_copy(local_path)
+
+
+def _engine_for(file_path: str) -> Optional[str]:
+    """
+    Pick the pandas engine for reading a file.
+
+    Returns "calamine" for the formats it supports when python-calamine is
+    installed, otherwise None so pandas falls back to its own default.
+    """
+    if _HAS_CALAMINE and file_path.lower().endswith(_CALAMINE_EXTENSIONS):
+        return "calamine"
+    return None
+
+
+@lru_cache(maxsize=32)
+def _cached_sheet_names(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    Read the sheet names of a file once per version of it.
+
+    The modification time and size are only used as part of the cache key, so
+    a changed file misses the cache.
+    """
+    sheet_names = _read_workbook_sheet_names(file_path)
+    if sheet_names is None:
+        with pd.ExcelFile(file_path, engine=_engine_for(file_path)) as excel_file:
+            sheet_names = excel_file.sheet_names
+    return tuple(sheet_names)
+
+
+def _pattern_suffixes(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Get the file suffixes for a pattern made only of "*.ext" alternatives.
+
+    Returns None when any alternative needs real glob matching. The suffixes
+    are normcased, so matching them against normcased names is as
+    case-sensitive as glob is on the platform.
+    """
+    alternatives = pattern.split("|")
+    if all(
+        alternative.startswith("*")
+        and not any(char in alternative[1:] for char in "*?[")
+        for alternative in alternatives
+    ):
+        return tuple(os.path.normcase(alternative[1:]) for alternative in alternatives)
+    return None
+
+
+def _scan_tree(
+    folder_path: str, suffixes: Tuple[str, ...], recursive: bool
+) -> Iterator[str]:
+    """
+    Yield paths of the non-hidden files in a folder that end with a suffix.
+
+    Suffixes that are plain extensions are matched with one set lookup per
+    file instead of an endswith call per suffix. Names are normcased before
+    matching, like the suffixes from _pattern_suffixes. Hidden folders are skipped
+    and symlinked folders are not followed when recursing.
+    """
+    extensions: Optional[FrozenSet[str]] = None
+    if all(suffix.count(".") == 1 and suffix.startswith(".") for suffix in suffixes):
+        extensions = frozenset(suffix[1:] for suffix in suffixes)
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            if recursive and entry.is_dir(follow_symlinks=False):
+                yield from _scan_tree(entry.path, suffixes, recursive)
+                continue
+
+            name = os.path.normcase(name)
+            if extensions is not None:
+                # A name without a dot has no extension, however it is spelled
+                _, dot, extension = name.rpartition(".")
+                matched = bool(dot) and extension in extensions
+            else:
+                matched = name.endswith(suffixes)
+            if matched and entry.is_file():
+                yield entry.path
+
+
+# Built once at import; building a TypeAdapter compiles its validator
+_FUNNEL_ENTRY_ADAPTER: Final = TypeAdapter(FunnelEntry)
+_FUNNEL_ENTRIES_ADAPTER: Final = TypeAdapter(List[FunnelEntry])
+_FILE_METADATA_ADAPTER: Final = TypeAdapter(ExcelFileMetadataTD)
+
+
+def _format_error(error: ErrorDetails, skip: int = 0) -> str:
+    """Format one Pydantic error as "field: message", dropping skip locations."""
+    location = ".".join(str(part) for part in error["loc"][skip:])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _group_errors_by_position(error: ValidationError) -> Dict[Any, List[str]]:
+    """Group the errors of a list validation by the position of the failed item."""
+    grouped: Dict[Any, List[str]] = {}
+    for item in error.errors():
+        position = item["loc"][0] if item["loc"] else None
+        grouped.setdefault(position, []).append(_format_error(item, skip=1))
+    return grouped
+
+
+@lru_cache(maxsize=None)
+def _nested_model(annotation: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """
+    Find the model class nested in a field annotation.
+
+    Returns:
+        Tuple of (model class, whether the field is a list of models), or None
+        if the field does not hold models. Optional wrappers are ignored.
+    """
+    if get_origin(annotation) is Union:
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                nested = _nested_model(arg)
+                if nested is not None:
+                    return nested
+        return None
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return args[0], True
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None
+
+
+def _construct_model(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Build a model with model_construct, constructing nested models recursively.
+
+    model_construct leaves nested dicts as plain dicts, so fields holding a
+    model or a list of models are walked and constructed the same way.
+    """
+    values = {}
+    for name, value in data.items():
+        field = model_cls.model_fields.get(name)
+        annotation: Any = field.annotation if field is not None else None
+        nested = _nested_model(annotation) if annotation is not None else None
+        if nested is not None:
+            nested_cls, is_list = nested
+            if is_list and isinstance(value, list):
+                value = [
+                    (
+                        _construct_model(nested_cls, item)
+                        if isinstance(item, dict)
+                        else item
+                    )
+                    for item in value
+                ]
+            elif not is_list and isinstance(value, dict):
+                value = _construct_model(nested_cls, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def _resolve_mapping(targets: Tuple[str, ...]) -> List[Tuple[int, Tuple[str, ...]]]:
+    """
+    Turn mapping targets into an assignment schedule.
+
+    Dotted targets such as custom_fields.<name> are split once here instead of
+    for every row.
+
+    Args:
+        targets: Mapping targets (field names) of the row columns, in order
+
+    Returns:
+        List of (column position, path of keys) pairs
+    """
+    return [
+        (position, tuple(target.split("."))) for position, target in enumerate(targets)
+    ]
+
+
+def _assign_path(target: Dict[str, Any], path: Tuple[str, ...], value: Any) -> None:
+    """
+    Set value at path in a nested dict, creating intermediate dicts as needed.
+    """
+    if len(path) == 1:
+        target[path[0]] = value
+        return
+    *parents, leaf = path
+    for key in parents:
+        target = target.setdefault(key, {})
+    target[leaf] = value
+
+
+@lru_cache(maxsize=32)
+def _compile_mapping(
+    targets: Tuple[str, ...],
+) -> Callable[[tuple, List[bool]], Dict[str, Any]]:
+    """
+    Generate a converter from row tuples to FunnelEntry records.
+
+    The converter is specialized for one column layout: positions, field names
+    and the nesting of dotted targets are all resolved here, so each row is
+    converted with straight-line code and no per-row dict or string work.
+
+    Args:
+        targets: Mapping targets (field names) of the row columns, in order
+
+    Returns:
+        Function taking a row tuple and its not-missing mask and returning
+        the record; missing cells are left out so optional fields keep
+        their defaults
+    """
+    lines = ["def convert(row, present):", "    record = {}"]
+    nested: Dict[str, str] = {}
+    for position, path in _resolve_mapping(targets):
+        head, rest = path[0], path[1:]
+        if rest and head not in nested:
+            # Nested dicts exist even when all of their cells are missing
+            nested[head] = f"nested_{len(nested)}"
+            lines.append(f"    {nested[head]} = record[{head!r}] = {{}}")
+
+        lines.append(f"    if present[{position}]:")
+        if not rest:
+            lines.append(f"        record[{head!r}] = row[{position}]")
+        elif len(rest) == 1:
+            lines.append(f"        {nested[head]}[{rest[0]!r}] = row[{position}]")
+        else:
+            lines.append(
+                f"        _assign_path({nested[head]}, {rest!r}, row[{position}])"
+            )
+    lines.append("    return record")
+
+    namespace: Dict[str, Any] = {"_assign_path": _assign_path}
+    code = compile("\n".join(lines), f"<mapping {targets!r}>", "exec")
+    exec(code, namespace)
+    convert: Callable[[tuple, List[bool]], Dict[str, Any]] = namespace["convert"]
+    return convert
+
+
+def _object_column(column: Optional[pd.Series], row_count: int) -> np.ndarray:
+    """
+    Convert a column to an object array with None for missing values.
+
+    A missing column becomes an array of None of the given length.
+    """
+    if column is None:
+        return np.full(row_count, None, dtype=object)
+    values: np.ndarray = column.astype(object).where(column.notna(), None).to_numpy()
+    return values
+
+
+def _extract_one_metadata(
+    file_path: str, engine: Optional[str] = None, prefetch_local: bool = True
+) -> Dict[str, Any]:
+    """
+    Get metadata for a single Excel file as a plain dict.
+
+    Defined at module level so it can be pickled for worker processes. Plain
+    dicts travel back to the parent cheaper than models, which are rebuilt
+    there without validating the already validated data again. The engine and
+    prefetch_local settings are those of the extractor scanning the folder.
+    """
+    with ExcelExtractor(
+        file_path, prefetch_local=prefetch_local, engine=engine
+    ) as extractor:
+        return extractor.get_file_metadata().model_dump()
 
 
 class ExcelExtractor:
@@ -19,24 +503,144 @@ class ExcelExtractor:
     """
 
     def __init__(
-        self, file_path: str = "Z:\\FUNNEL with PROBABILITY TRACKING_Teefa.xlsx"
+        self,
+        file_path: str = "Z:\\FUNNEL with PROBABILITY TRACKING_Teefa.xlsx",
+        prefetch_local: bool = True,
+        engine: Optional[str] = None,
     ):
         """
         Initialize the Excel extractor with the path to the Excel file.
 
         Args:
             file_path: Path to the Excel file to extract data from
+            prefetch_local: Copy files on network drives to a local temporary
+                file once and parse the copy (default: True)
+            engine: pandas engine used for reading the file (default: calamine
+                when available, otherwise the pandas default)
         """
         self.file_path = file_path
+        self.prefetch_local = prefetch_local
+        self.engine = engine
         self.logger = ContextLogger("extraction")
         self.logger.add_context(file_path=file_path)
 
-    def extract_data(self, sheet_name: Optional[str] = None, **kwargs) -> pd.DataFrame:
+        # Workbook opened on first use and shared by the reading methods, with
+        # the (mtime_ns, size, engine) it was opened for
+        self._workbook: Optional[pd.ExcelFile] = None
+        self._workbook_key: Optional[Tuple[int, int, Optional[str]]] = None
+
+        # Local copy of a network file, with the (mtime_ns, size) it was made for
+        self._local_path: Optional[str] = None
+        self._local_version: Optional[Tuple[int, int]] = None
+
+    def __enter__(self) -> "ExcelExtractor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the workbook kept open by the extractor and delete its local copy.
+
+        The extractor stays usable and reopens the file when needed.
+        """
+        self._close_workbook()
+        self._release_local_copy()
+
+    def _close_workbook(self) -> None:
+        """Close the workbook kept open by the extractor, if any."""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+            self._workbook_key = None
+
+    def _release_local_copy(self) -> None:
+        """Delete the local copy made by the extractor, if any."""
+        if self._local_path is not None:
+            _remove_local_copy(self._local_path)
+            self._local_path = None
+            self._local_version = None
+
+    def _open_workbook(
+        self, file_stats: os.stat_result, engine: Optional[str] = None
+    ) -> pd.ExcelFile:
+        """
+        Get the open workbook, opening it on first use.
+
+        Sheet reads then share one parse of the file instead of opening it
+        again for every call. A file that changed since it was opened, or a
+        different engine, gets a fresh workbook.
+
+        Args:
+            file_stats: Result of os.stat on file_path
+            engine: pandas engine to parse the file with (default: the engine
+                of the extractor)
+
+        Returns:
+            pandas ExcelFile for the current version of the file
+        """
+        if engine is None:
+            engine = self._default_engine()
+        key = (file_stats.st_mtime_ns, file_stats.st_size, engine)
+        if self._workbook is None or self._workbook_key != key:
+            self._close_workbook()
+            self._workbook = pd.ExcelFile(self._read_path(file_stats), engine=engine)
+            self._workbook_key = key
+        return self._workbook
+
+    def _read_path(self, file_stats: os.stat_result) -> str:
+        """
+        Get the path the workbook should be parsed from.
+
+        Args:
+            file_stats: Result of os.stat on file_path
+
+        Returns:
+            Path to a local copy for files on network drives when prefetching is
+            enabled, otherwise file_path itself
+        """
+        if not (self.prefetch_local and _is_network_path(self.file_path)):
+            return self.file_path
+
+        # Copy only when the source changed since the last copy. The copy is
+        # owned by this extractor, so only its own workbook can be reading the
+        # old one, and that workbook belongs to a stale version anyway.
+        version = (file_stats.st_mtime_ns, file_stats.st_size)
+        if (
+            self._local_path is None
+            or self._local_version != version
+            or not os.path.exists(self._local_path)
+        ):
+            local_path = _local_copy(self.file_path)
+            if self._workbook_key is not None and self._workbook_key[:2] != version:
+                self._close_workbook()
+            self._release_local_copy()
+            self._local_path, self._local_version = local_path, version
+        return self._local_path
+
+    def _default_engine(self) -> Optional[str]:
+        """
+        Pick the pandas engine for reading the file.
+
+        Returns the engine given to the extractor if any, otherwise "calamine"
+        for the formats it supports when python-calamine is installed, or None
+        so pandas falls back to its own default.
+        """
+        if self.engine is not None:
+            return self.engine
+        return _engine_for(self.file_path)
+
+    def extract_data(
+        self, sheet_name: Optional[str] = None, engine: Optional[str] = None, **kwargs
+    ) -> pd.DataFrame:
         """
         Extract data from the Excel file.
 
         Args:
             sheet_name: Name of the sheet to extract data from
+            engine: pandas engine to parse the file with (default: the engine
+                of the extractor)
             **kwargs: Additional arguments to pass to pandas.read_excel
 
         Returns:
@@ -53,11 +657,18 @@ class ExcelExtractor:
         self.logger.info(f"Extracting data from Excel file")
 
         try:
-            if not os.path.exists(self.file_path):
+            # os.stat raises PermissionError where os.path.exists would hide it
+            try:
+                file_stats = os.stat(self.file_path)
+            except FileNotFoundError:
                 self.logger.error(f"Excel file not found")
                 raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name, **kwargs)
+            df = pd.read_excel(
+                self._open_workbook(file_stats, engine),
+                sheet_name=sheet_name,
+                **kwargs,
+            )
             self.logger.info(f"Successfully extracted data with shape {df.shape}")
             return df
 
@@ -94,8 +705,36 @@ class ExcelExtractor:
         self.logger.info(f"Getting sheet names from Excel file")
 
         try:
-            excel_file = pd.ExcelFile(self.file_path)
-            sheet_names = excel_file.sheet_names
+            file_stats = os.stat(self.file_path)
+
+            # Metadata cached for this version of the file already lists them
+            metadata = self._cached_metadata(cache_key(self.file_path, file_stats))
+            if metadata is not None:
+                sheet_names = [sheet["sheet_name"] for sheet in metadata["sheets"]]
+                self.logger.info(f"Found {len(sheet_names)} sheets (cached)")
+                return sheet_names
+
+            # A workbook already open for this version of the file lists them
+            if (
+                self._workbook is not None
+                and self._workbook_key is not None
+                and self._workbook_key[:2]
+                == (file_stats.st_mtime_ns, file_stats.st_size)
+            ):
+                sheet_names = list(self._workbook.sheet_names)
+                self.logger.info(f"Found {len(sheet_names)} sheets")
+                return sheet_names
+
+            sheet_names = list(
+                # Only the small workbook part is read, so a local copy of the
+                # whole file would cost more than it saves
+                _cached_sheet_names(
+                    os.path.abspath(self.file_path),
+                    file_stats.st_mtime_ns,
+                    file_stats.st_size,
+                )
+            )
+
             self.logger.info(f"Found {len(sheet_names)} sheets")
             return sheet_names
 
@@ -117,12 +756,26 @@ class ExcelExtractor:
             self.logger.error(f"Error reading Excel file: {str(e)}", exc_info=True)
             raise Exception(f"Error reading Excel file: {str(e)}")
 
-    def get_file_metadata(self) -> ExcelFileMetadata:
+    @overload
+    def get_file_metadata(
+        self, as_pydantic: Literal[True] = True
+    ) -> ExcelFileMetadata: ...
+
+    @overload
+    def get_file_metadata(self, as_pydantic: Literal[False]) -> ExcelFileMetadataTD: ...
+
+    def get_file_metadata(
+        self, as_pydantic: bool = True
+    ) -> Union[ExcelFileMetadata, ExcelFileMetadataTD]:
         """
         Get metadata about the Excel file.
 
+        Args:
+            as_pydantic: Return a validated ExcelFileMetadata model (default:
+                True). Otherwise the plain dict gathered internally is returned.
+
         Returns:
-            ExcelFileMetadata object with file metadata
+            ExcelFileMetadata object, or ExcelFileMetadataTD dict, with file metadata
 
         Raises:
             Same exceptions as extract_data
@@ -130,12 +783,13 @@ class ExcelExtractor:
         self.logger.info(f"Getting metadata for Excel file")
 
         try:
-            if not os.path.exists(self.file_path):
+            # Get file metadata; a single stat doubles as the existence check
+            try:
+                file_stats = os.stat(self.file_path)
+            except FileNotFoundError:
                 self.logger.error(f"Excel file not found")
                 raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
-            # Get file metadata
-            file_stats = os.stat(self.file_path)
             last_modified = datetime.fromtimestamp(file_stats.st_mtime)
             file_size = file_stats.st_size
 
@@ -143,46 +797,36 @@ class ExcelExtractor:
                 f"File size: {file_size} bytes, Last modified: {last_modified}"
             )
 
-            # Get sheet metadata
-            sheet_metadata_list = []
-            excel_file = pd.ExcelFile(self.file_path)
-
-            for sheet_name in excel_file.sheet_names:
-                self.logger.info(f"Processing metadata for sheet: {sheet_name}")
-
-                # Read just the header row to get column names
-                df_header = pd.read_excel(
-                    self.file_path, sheet_name=sheet_name, nrows=0
-                )
-                column_headers = df_header.columns.tolist()
-
-                # Get row and column counts
-                df = pd.read_excel(self.file_path, sheet_name=sheet_name)
-                row_count = len(df)
-                column_count = len(df.columns)
-
+            # The key changes with the modification time and size, so a
+            # rewritten file is never served stale metadata
+            key = cache_key(self.file_path, file_stats)
+            metadata = self._cached_metadata(key)
+            if metadata is not None:
+                metadata["file_path"] = self.file_path
                 self.logger.info(
-                    f"Sheet {sheet_name}: {row_count} rows, {column_count} columns"
+                    f"Using cached metadata for {len(metadata['sheets'])} sheets"
                 )
-
-                sheet_metadata = ExcelSheetMetadata(
-                    sheet_name=sheet_name,
-                    row_count=row_count,
-                    column_count=column_count,
-                    column_headers=column_headers,
+            else:
+                # Get sheet metadata
+                sheet_metadata_list = self._read_sheet_metadata(file_stats)
+
+                metadata = ExcelFileMetadataTD(
+                    file_path=self.file_path,
+                    file_size=file_size,
+                    last_modified=last_modified,
+                    sheets=sheet_metadata_list,
+                )
+                metadata_cache.put(
+                    key, _FILE_METADATA_ADAPTER.dump_json(metadata).decode()
                 )
-                sheet_metadata_list.append(sheet_metadata)
 
-            metadata = ExcelFileMetadata(
-                file_path=self.file_path,
-                file_size=file_size,
-                last_modified=last_modified,
-                sheets=sheet_metadata_list,
-            )
+                self.logger.info(
+                    f"Successfully gathered metadata for {len(sheet_metadata_list)} sheets"
+                )
 
-            self.logger.info(
-                f"Successfully gathered metadata for {len(sheet_metadata_list)} sheets"
-            )
+            # Models are only built, and validated, for callers that want them
+            if as_pydantic:
+                return ExcelFileMetadata.model_validate(metadata)
             return metadata
 
         except FileNotFoundError:
@@ -203,8 +847,406 @@ class ExcelExtractor:
             self.logger.error(f"Error getting file metadata: {str(e)}", exc_info=True)
             raise Exception(f"Error getting file metadata: {str(e)}")
 
+    def _cached_metadata(self, key: str) -> Optional[ExcelFileMetadataTD]:
+        """
+        Look up cached metadata, dropping entries that no longer validate.
+
+        A truncated or hand-edited cache file is treated as a miss, so the
+        workbook is read again and the entry rewritten.
+
+        Args:
+            key: Key from cache_key
+
+        Returns:
+            The cached metadata, or None on a miss
+        """
+        cached = metadata_cache.get(key)
+        if cached is None:
+            return None
+
+        try:
+            return _FILE_METADATA_ADAPTER.validate_json(cached)
+        except ValidationError as e:
+            self.logger.warning(
+                f"Ignoring invalid metadata cache entry: {e.error_count()} errors"
+            )
+            metadata_cache.discard(key)
+            return None
+
+    def _read_sheet_metadata(
+        self, file_stats: os.stat_result
+    ) -> List[ExcelSheetMetadataTD]:
+        """
+        Parse the workbook for sheet metadata with the fastest available reader.
+
+        Args:
+            file_stats: Result of os.stat on file_path
+        """
+        # openpyxl in read-only mode only reads the header row and the sheet
+        # dimensions, which beats loading whole sheets with any other reader
+        if self.file_path.lower().endswith(_OPENPYXL_EXTENSIONS):
+            return self._get_sheet_metadata_openpyxl(self._read_path(file_stats))
+        if self._default_engine() == "calamine":
+            return self._get_sheet_metadata_calamine(self._read_path(file_stats))
+        return self._get_sheet_metadata_pandas(self._open_workbook(file_stats))
+
+    def _get_sheet_metadata_openpyxl(
+        self, file_path: str
+    ) -> List[ExcelSheetMetadataTD]:
+        """
+        Gather sheet metadata from a read-only openpyxl workbook.
+
+        Only the header row is read; row and column counts come from the sheet
+        dimensions, so no sheet is materialized into a DataFrame. External
+        links are not loaded since they never affect the metadata.
+        """
+        sheet_metadata_list = []
+        workbook = openpyxl.load_workbook(
+            file_path, read_only=True, data_only=True, keep_links=False
+        )
+
+        try:
+            for worksheet in workbook.worksheets:
+                sheet_name = worksheet.title
+                self.logger.info(f"Processing metadata for sheet: {sheet_name}")
+
+                # Read just the header row to get column names
+                header_row = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+                column_headers = [
+                    str(header) if header is not None else f"Unnamed: {i}"
+                    for i, header in enumerate(header_row)
+                ]
+
+                # Files written without a dimension record report None, in
+                # which case the rows have to be counted once; only the first
+                # column is materialized, which still yields every row
+                max_row = worksheet.max_row
+                if max_row is None:
+                    max_row = sum(
+                        1 for _ in worksheet.iter_rows(max_col=1, values_only=True)
+                    )
+                row_count = max_row - 1
+                column_count = worksheet.max_column or len(column_headers)
+
+                self.logger.info(
+                    f"Sheet {sheet_name}: {row_count} rows, {column_count} columns"
+                )
+
+                sheet_metadata_list.append(
+                    ExcelSheetMetadataTD(
+                        sheet_name=sheet_name,
+                        row_count=row_count,
+                        column_count=column_count,
+                        column_headers=column_headers,
+                    )
+                )
+        finally:
+            workbook.close()
+
+        return sheet_metadata_list
+
+    def _get_sheet_metadata_calamine(
+        self, file_path: str
+    ) -> List[ExcelSheetMetadataTD]:
+        """
+        Gather sheet metadata straight from python-calamine.
+
+        Sheets are read into calamine's own cell ranges without building
+        DataFrames. Counts follow the openpyxl reader: the first row of the
+        sheet is the header and dimensions are measured from cell A1.
+        """
+        sheet_metadata_list = []
+        workbook = python_calamine.CalamineWorkbook.from_path(file_path)
+
+        try:
+            for sheet_name in workbook.sheet_names:
+                self.logger.info(f"Processing metadata for sheet: {sheet_name}")
+                worksheet = workbook.get_sheet_by_name(sheet_name)
+
+                start, end = worksheet.start, worksheet.end
+                if start is None or end is None:
+                    row_count, column_count, column_headers = 0, 0, []
+                else:
+                    (first_row, first_column), (last_row, last_column) = start, end
+                    row_count = last_row
+                    column_count = last_column + 1
+
+                    # The used range may start below or right of A1, in which
+                    # case the leading cells of the header row are empty
+                    header_row: List[Any] = [""] * column_count
+                    if first_row == 0:
+                        header_row[first_column:] = worksheet.to_python(nrows=1)[0]
+                    column_headers = [
+                        str(header) if header != "" else f"Unnamed: {i}"
+                        for i, header in enumerate(header_row)
+                    ]
+
+                self.logger.info(
+                    f"Sheet {sheet_name}: {row_count} rows, {column_count} columns"
+                )
+
+                sheet_metadata_list.append(
+                    ExcelSheetMetadataTD(
+                        sheet_name=sheet_name,
+                        row_count=row_count,
+                        column_count=column_count,
+                        column_headers=column_headers,
+                    )
+                )
+        finally:
+            workbook.close()
+
+        return sheet_metadata_list
+
+    def _get_sheet_metadata_pandas(
+        self, excel_file: pd.ExcelFile
+    ) -> List[ExcelSheetMetadataTD]:
+        """
+        Gather sheet metadata through pandas for formats openpyxl cannot open.
+
+        Each sheet is parsed from the already open workbook a single time for
+        both its headers and its dimensions.
+        """
+        sheet_metadata_list = []
+
+        for sheet_name in excel_file.sheet_names:
+            self.logger.info(f"Processing metadata for sheet: {sheet_name}")
+
+            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            column_headers = [str(header) for header in df.columns]
+            row_count = len(df)
+            column_count = len(df.columns)
+
+            self.logger.info(
+                f"Sheet {sheet_name}: {row_count} rows, {column_count} columns"
+            )
+
+            sheet_metadata_list.append(
+                ExcelSheetMetadataTD(
+                    sheet_name=sheet_name,
+                    row_count=row_count,
+                    column_count=column_count,
+                    column_headers=column_headers,
+                )
+            )
+
+        return sheet_metadata_list
+
+    def _validate_columns(
+        self, df: pd.DataFrame, row_offset: int = 0
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Coerce and validate mapped columns for all rows at once.
+
+        Applies the same rules as the FunnelEntry validators (required fields,
+        numeric and date types, probability range, status values and date order)
+        as vectorized column operations.
+
+        Args:
+            df: DataFrame with columns already renamed to FunnelEntry field names
+            row_offset: Position of the first row of df within the sheet, used to
+                number the rows in error messages
+
+        Returns:
+            Tuple of (DataFrame with the valid rows and coerced columns,
+            list of validation error messages for the invalid rows)
+        """
+        row_errors: Dict[int, List[str]] = {}
+
+        def flag(mask: Any, message: str) -> None:
+            # tolist gives plain ints, matching the declared keys
+            for position in np.flatnonzero(np.asarray(mask, dtype=bool)).tolist():
+                row_errors.setdefault(position, []).append(message)
+
+        for field in _REQUIRED_FIELDS:
+            if field not in df.columns:
+                flag(np.ones(len(df), dtype=bool), f"{field}: field required")
+            else:
+                flag(df[field].isna(), f"{field}: field required")
+
+        # Columns that were read with the right dtype need no coercion, and
+        # those that cannot fail to convert are cast in a single astype call
+        direct_casts = {}
+        for field, dtype in _FIELD_DTYPES.items():
+            if field not in df.columns:
+                continue
+            column = df[field]
+
+            if dtype == "string":
+                if not isinstance(column.dtype, pd.StringDtype):
+                    direct_casts[field] = dtype
+
+            elif dtype == "float64":
+                if is_float_dtype(column):
+                    continue
+                if is_numeric_dtype(column):
+                    direct_casts[field] = dtype
+                    continue
+                coerced = pd.to_numeric(column, errors="coerce").astype(dtype)
+                flag(coerced.isna() & column.notna(), f"{field}: not a valid float")
+                df[field] = coerced
+
+            elif not is_datetime64_any_dtype(column):
+                coerced = pd.to_datetime(column, errors="coerce")
+                flag(coerced.isna() & column.notna(), f"{field}: invalid datetime")
+                df[field] = coerced
+
+        if direct_casts:
+            df = df.astype(direct_casts)
+
+        if "probability" in df.columns:
+            probability = df["probability"]
+            flag(
+                probability.notna() & ~probability.between(0, 100, inclusive="both"),
+                "probability: Probability must be between 0 and 100",
+            )
+
+        if "status" in df.columns:
+            status = df["status"]
+            flag(status.notna() & ~status.isin(_STATUS_VALUES), _STATUS_ERROR)
+
+        if "start_date" in df.columns and "expected_close_date" in df.columns:
+            flag(
+                df["start_date"] > df["expected_close_date"],
+                "Start date must be before expected close date",
+            )
+
+        validation_errors = [
+            f"Row {row_offset + position + 2}: {'; '.join(messages)}"
+            for position, messages in sorted(row_errors.items())
+        ]
+
+        if row_errors:
+            invalid_mask = np.zeros(len(df), dtype=bool)
+            invalid_mask[list(row_errors)] = True
+            df = df.loc[~invalid_mask]
+
+        return df, validation_errors
+
+    def _build_entries(
+        self, df: pd.DataFrame, validate: bool = False, check_first_row: bool = False
+    ) -> Tuple[List[FunnelEntry], List[str]]:
+        """
+        Build FunnelEntry objects for rows that already passed _validate_columns.
+
+        Args:
+            df: DataFrame of validated rows with FunnelEntry field names
+            validate: Run the full Pydantic validation for every row instead of
+                constructing the entries directly
+            check_first_row: When not validating every row, still validate the
+                first one to catch drift between the column checks and the model
+
+        Returns:
+            Tuple of (list of FunnelEntry objects, list of validation error messages)
+        """
+        entry_columns = [c for c in df.columns if c in FunnelEntry.model_fields]
+        custom_columns = [
+            c
+            for c in df.columns
+            if isinstance(c, str) and c.startswith(_CUSTOM_FIELDS_PREFIX)
+        ]
+        columns = tuple(entry_columns + custom_columns)
+        df_entries = df[list(columns)]
+
+        # One vectorized scan for missing values; the generated converter
+        # leaves None/NaN cells out so optional fields keep their defaults
+        notna_mask = df_entries.notna().to_numpy().tolist()
+        convert = _compile_mapping(columns)
+
+        rows = df_entries.itertuples(index=False, name=None)
+        records = [convert(row, present) for row, present in zip(rows, notna_mask)]
+
+        labels = df.index
+        if validate:
+            # Hand the whole chunk to pydantic-core in a single call
+            try:
+                return _FUNNEL_ENTRIES_ADAPTER.validate_python(records), []
+            except ValidationError as e:
+                return [], [
+                    f"Row {labels[position] + 2}: {'; '.join(messages)}"
+                    for position, messages in _group_errors_by_position(e).items()
+                ]
+
+        validation_errors = []
+        if check_first_row and records:
+            try:
+                _FUNNEL_ENTRY_ADAPTER.validate_python(records[0])
+            except ValidationError as e:
+                messages = [_format_error(error) for error in e.errors()]
+                validation_errors.append(f"Row {labels[0] + 2}: {'; '.join(messages)}")
+
+        entries = [_construct_model(FunnelEntry, record) for record in records]
+        return entries, validation_errors
+
+    def _read_mapped(
+        self, sheet_name: Optional[str], mapping: Optional[Mapping[str, str]]
+    ) -> pd.DataFrame:
+        """
+        Read a sheet and rename its columns to FunnelEntry field names.
+
+        Args:
+            sheet_name: Name of the sheet to extract data from
+            mapping: Dictionary mapping Excel column names to FunnelEntry field
+                names (default: the standard funnel layout)
+
+        Returns:
+            DataFrame with the mapped columns renamed
+        """
+        # Default mapping if none provided; a custom mapping's key view
+        # serves as its key set without copying it
+        mapping_keys: AbstractSet[str]
+        if mapping is None:
+            mapping = _DEFAULT_MAPPING
+            mapping_keys = _DEFAULT_MAPPING_KEYS
+            self.logger.info(f"Using default column mapping")
+        else:
+            mapping_keys = mapping.keys()
+            self.logger.info(f"Using custom column mapping")
+
+        # Extract raw data
+        # Text columns of the default layout are read straight into the
+        # string dtype so they skip type inference and later coercion
+        dtype = dict(_DEFAULT_DTYPE) if mapping is _DEFAULT_MAPPING else None
+        df = self.extract_data(sheet_name=sheet_name, dtype=dtype)
+        self.logger.info(f"Extracted {len(df)} rows of raw data")
+
+        # Rename columns according to mapping with a single pass over the
+        # sheet's columns, skipping the rename when nothing overlaps
+        mapping_get = mapping.get
+        mapped_columns = mapping_keys & set(df.columns)
+        if mapped_columns:
+            df_mapped = df.set_axis([mapping_get(c, c) for c in df.columns], axis=1)
+        else:
+            df_mapped = df
+
+        self.logger.info(
+            f"Mapped columns: {', '.join(c for c in df.columns if c in mapped_columns)}"
+        )
+        return df_mapped
+
+    def _raise_validation_errors(self, validation_errors: List[str]) -> None:
+        """
+        Log validation errors as one aggregated record and raise them.
+
+        Raises:
+            ValueError: Always, listing every validation error
+        """
+        # One aggregated record instead of a warning per failed row
+        logged_errors = "; ".join(validation_errors[:_MAX_LOGGED_ERRORS])
+        remaining = len(validation_errors) - _MAX_LOGGED_ERRORS
+        if remaining > 0:
+            logged_errors += f" ...+{remaining} more"
+        self.logger.error(
+            f"Found {len(validation_errors)} validation errors: {logged_errors}"
+        )
+        raise ValueError(f"Data validation errors: {'; '.join(validation_errors)}")
+
     def extract_validated_data(
-        self, sheet_name: Optional[str] = None, mapping: Dict[str, str] = None
+        self,
+        sheet_name: Optional[str] = None,
+        mapping: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 10_000,
+        validate: Optional[bool] = None,
     ) -> FunnelData:
         """
         Extract data from Excel and validate it using Pydantic models.
@@ -212,6 +1254,10 @@ class ExcelExtractor:
         Args:
             sheet_name: Name of the sheet to extract data from
             mapping: Dictionary mapping Excel column names to FunnelEntry field names
+            chunk_size: Number of rows validated and converted per batch
+            validate: Run the full Pydantic validation for every row (default:
+                EXTRACTION_VALIDATE). Otherwise rows that pass the column checks
+                are constructed directly and only the first one is validated.
 
         Returns:
             FunnelData object with validated data
@@ -225,90 +1271,217 @@ class ExcelExtractor:
         self.logger.info(f"Extracting and validating data")
 
         try:
-            # Default mapping if none provided
-            if mapping is None:
-                mapping = {
-                    "Company": "company_name",
-                    "Project": "project_name",
-                    "Value": "value",
-                    "Probability (%)": "probability",
-                    "Status": "status",
-                    "Start Date": "start_date",
-                    "Expected Close": "expected_close_date",
-                    "Notes": "notes",
-                    "Last Updated": "last_updated",
-                }
-                self.logger.info(f"Using default column mapping")
-            else:
-                self.logger.info(f"Using custom column mapping")
+            df_mapped = self._read_mapped(sheet_name, mapping)
+
+            # Validate whole columns at once and build entries only for the rows
+            # that passed, skipping the per-row Pydantic validators unless asked
+            # for. Rows are handled one chunk at a time so only a single chunk's
+            # intermediate arrays are alive next to the entries built so far.
+            if validate is None:
+                validate = EXTRACTION_VALIDATE
+            entries: List[FunnelEntry] = []
+            validation_errors: List[str] = []
+            total_value = 0.0
+
+            for start in range(0, len(df_mapped), chunk_size):
+                df_chunk, chunk_errors = self._validate_columns(
+                    df_mapped.iloc[start : start + chunk_size].copy(), row_offset=start
+                )
+                validation_errors.extend(chunk_errors)
+
+                # Once any row has failed the result is discarded, so stop building
+                if not validation_errors and len(df_chunk):
+                    chunk_entries, chunk_errors = self._build_entries(
+                        df_chunk, validate=validate, check_first_row=not entries
+                    )
+                    entries.extend(chunk_entries)
+                    validation_errors.extend(chunk_errors)
+                    # Sum the already-coerced value column instead of the entries
+                    total_value += float(df_chunk["value"].sum())
+                del df_chunk
+
+            if validation_errors:
+                self._raise_validation_errors(validation_errors)
+
+            # Create FunnelData object
+            funnel_data = FunnelData(
+                entries=entries,
+                extraction_date=datetime.now(),
+                source_file=self.file_path,
+                sheet_name=sheet_name,
+                total_value=total_value if entries else None,
+            )
 
-            # Extract raw data
-            df = self.extract_data(sheet_name=sheet_name)
-            self.logger.info(f"Extracted {len(df)} rows of raw data")
+            self.logger.info(
+                f"Successfully validated {len(entries)} entries with total value {funnel_data.total_value}"
+            )
+            return funnel_data
 
-            # Rename columns according to mapping
-            df_mapped = df.rename(
-                columns={k: v for k, v in mapping.items() if k in df.columns}
+        except Exception as e:
+            if isinstance(e, ValueError) and "Data validation errors" in str(e):
+                # Validation errors were already logged above
+                raise
+            self.logger.error(
+                f"Error extracting and validating data: {str(e)}", exc_info=True
             )
+            raise Exception(f"Error extracting and validating data: {str(e)}")
+
+    def extract_columnar_data(
+        self,
+        sheet_name: Optional[str] = None,
+        mapping: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 10_000,
+    ) -> FunnelDataColumnar:
+        """
+        Extract data from Excel and validate it into one array per field.
+
+        Rows are checked with the same column-wise rules as
+        extract_validated_data, but no FunnelEntry is built; entries are only
+        materialized if FunnelDataColumnar.entries is used.
 
-            mapped_columns = [k for k in mapping.keys() if k in df.columns]
-            self.logger.info(f"Mapped columns: {', '.join(mapped_columns)}")
+        Args:
+            sheet_name: Name of the sheet to extract data from
+            mapping: Dictionary mapping Excel column names to FunnelEntry field names
+            chunk_size: Number of rows validated per batch
+
+        Returns:
+            FunnelDataColumnar object with validated data
 
-            # Convert DataFrame to list of dictionaries
-            records = df_mapped.to_dict(orient="records")
+        Raises:
+            ValueError: If data validation fails
+            Other exceptions same as extract_data
+        """
+        context = {"sheet_name": sheet_name} if sheet_name else {}
+        self.logger.add_context(**context)
+        self.logger.info(f"Extracting and validating columnar data")
 
-            # Create and validate FunnelEntry objects
-            entries = []
-            validation_errors = []
+        try:
+            df_mapped = self._read_mapped(sheet_name, mapping)
 
-            for i, record in enumerate(records):
-                try:
-                    # Filter out None/NaN values to avoid validation errors for optional fields
-                    cleaned_record = {k: v for k, v in record.items() if pd.notna(v)}
-                    entry = FunnelEntry(**cleaned_record)
-                    entries.append(entry)
-                except Exception as e:
-                    error_msg = f"Row {i + 2}: {str(e)}"
-                    validation_errors.append(error_msg)
-                    self.logger.warning(f"Validation error: {error_msg}")
+            valid_chunks = []
+            validation_errors: List[str] = []
+            for start in range(0, len(df_mapped), chunk_size):
+                df_chunk, chunk_errors = self._validate_columns(
+                    df_mapped.iloc[start : start + chunk_size].copy(), row_offset=start
+                )
+                validation_errors.extend(chunk_errors)
+                # Once any row has failed the result is discarded, so stop keeping
+                if not validation_errors:
+                    valid_chunks.append(df_chunk)
 
             if validation_errors:
-                self.logger.error(f"Found {len(validation_errors)} validation errors")
-                raise ValueError(
-                    f"Data validation errors: {'; '.join(validation_errors)}"
+                self._raise_validation_errors(validation_errors)
+
+            df_valid = pd.concat(valid_chunks) if valid_chunks else df_mapped.iloc[:0]
+            row_count = len(df_valid)
+
+            columns: Dict[str, Any] = {}
+            for field in FunnelDataColumnar.columns:
+                column = df_valid[field] if field in df_valid.columns else None
+                if field in FunnelDataColumnar.float_columns:
+                    columns[field] = (
+                        column.to_numpy(dtype=np.float64, na_value=np.nan)
+                        if column is not None
+                        else np.full(row_count, np.nan)
+                    )
+                elif field in FunnelDataColumnar.datetime_columns:
+                    columns[field] = (
+                        column.to_numpy(dtype="datetime64[ns]")
+                        if column is not None
+                        else np.full(row_count, np.datetime64("NaT", "ns"))
+                    )
+                else:
+                    columns[field] = _object_column(column, row_count)
+
+            custom_fields = {
+                column[len(_CUSTOM_FIELDS_PREFIX) :]: _object_column(
+                    df_valid[column], row_count
                 )
+                for column in df_valid.columns
+                if isinstance(column, str) and column.startswith(_CUSTOM_FIELDS_PREFIX)
+            }
 
-            # Create FunnelData object
-            funnel_data = FunnelData(
-                entries=entries,
+            funnel_data = FunnelDataColumnar(
+                **columns,
+                custom_fields=custom_fields,
                 extraction_date=datetime.now(),
                 source_file=self.file_path,
                 sheet_name=sheet_name,
             )
 
             self.logger.info(
-                f"Successfully validated {len(entries)} entries with total value {funnel_data.total_value}"
+                f"Successfully validated {row_count} rows with total value {funnel_data.total_value}"
             )
             return funnel_data
 
         except Exception as e:
             if isinstance(e, ValueError) and "Data validation errors" in str(e):
-                # Already logged individual validation errors above
+                # Validation errors were already logged above
                 raise
             self.logger.error(
-                f"Error extracting and validating data: {str(e)}", exc_info=True
+                f"Error extracting and validating columnar data: {str(e)}",
+                exc_info=True,
             )
-            raise Exception(f"Error extracting and validating data: {str(e)}")
+            raise Exception(f"Error extracting and validating columnar data: {str(e)}")
+
+    def extract_validated_data_from_json(
+        self,
+        data: Union[str, bytes],
+        sheet_name: Optional[str] = None,
+        source_file: Optional[str] = None,
+    ) -> FunnelData:
+        """
+        Validate a JSON array of funnel entries, such as an export of a sheet.
+
+        The raw JSON is parsed and validated in a single pass by pydantic-core,
+        without building an intermediate list of dicts.
+
+        Args:
+            data: JSON array of objects with FunnelEntry field names
+            sheet_name: Name of the sheet the entries came from
+            source_file: Source of the entries (default: the extractor's file path)
+
+        Returns:
+            FunnelData object with validated data
+
+        Raises:
+            ValueError: If data validation fails
+        """
+        self.logger.info(f"Validating {len(data)} bytes of JSON funnel entries")
+
+        try:
+            entries = _FUNNEL_ENTRIES_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            validation_errors = [
+                f"Entry {position}: {'; '.join(messages)}"
+                for position, messages in _group_errors_by_position(e).items()
+            ]
+            self.logger.error(f"Found {len(validation_errors)} validation errors")
+            raise ValueError(f"Data validation errors: {'; '.join(validation_errors)}")
+
+        funnel_data = FunnelData(
+            entries=entries,
+            extraction_date=datetime.now(),
+            source_file=source_file or self.file_path,
+            sheet_name=sheet_name,
+        )
+
+        self.logger.info(
+            f"Successfully validated {len(entries)} entries with total value {funnel_data.total_value}"
+        )
+        return funnel_data
 
     def scan_folder_for_excel_files(
-        self, folder_path: str, pattern: str = "*.xlsx"
+        self, folder_path: str, pattern: str = "*.xlsx", recursive: bool = False
     ) -> List[str]:
         """
         Scan a folder for Excel files matching the given pattern.
 
         Args:
             folder_path: Path to the folder to scan
-            pattern: Glob pattern for matching files (default: "*.xlsx")
+            pattern: Glob pattern for matching files, with alternatives separated
+                by "|" (default: "*.xlsx")
+            recursive: Also scan the subfolders (default: False)
 
         Returns:
             List of file paths
@@ -329,13 +1502,31 @@ class ExcelExtractor:
                 self.logger.error(f"Not a directory")
                 raise ValueError(f"Not a directory: {folder_path}")
 
-            # Use glob to find all files matching the pattern
-            file_paths = glob.glob(os.path.join(folder_path, pattern))
+            suffixes = _pattern_suffixes(pattern)
+            if suffixes is not None:
+                # Plain "*.ext" patterns only need a suffix check, which avoids
+                # fnmatch and uses the file type cached by scandir
+                file_paths = list(_scan_tree(folder_path, suffixes, recursive))
+            else:
+                # Use glob for anything more elaborate than a suffix match
+                prefix = os.path.join(folder_path, "**") if recursive else folder_path
+                # Alternatives can overlap, so keep each file once, in the
+                # order it was first found
+                file_paths = list(
+                    dict.fromkeys(
+                        file_path
+                        for alternative in pattern.split("|")
+                        for file_path in glob.glob(
+                            os.path.join(prefix, alternative), recursive=recursive
+                        )
+                    )
+                )
             self.logger.info(f"Found {len(file_paths)} Excel files")
 
             # Log the found files
-            for file_path in file_paths:
-                self.logger.debug(f"Found file: {file_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for file_path in file_paths:
+                    self.logger.debug(f"Found file: {file_path}")
 
             return file_paths
 
@@ -356,3 +1547,63 @@ class ExcelExtractor:
                 f"Error scanning folder for Excel files: {str(e)}", exc_info=True
             )
             raise Exception(f"Error scanning folder for Excel files: {str(e)}")
+
+    def get_metadata_for_folder(
+        self,
+        folder_path: str,
+        pattern: str = "*.xlsx",
+        max_workers: Optional[int] = None,
+        recursive: bool = False,
+    ) -> List[ExcelFileMetadata]:
+        """
+        Get metadata for every Excel file in a folder, one worker process per core.
+
+        Workbook parsing is CPU-bound and holds the GIL, so the files are
+        spread across a process pool rather than threads. The files are read
+        with the engine and prefetch_local settings of this extractor.
+
+        Args:
+            folder_path: Path to the folder to scan
+            pattern: Glob pattern for matching files (default: "*.xlsx")
+            max_workers: Number of worker processes (default: number of CPUs)
+            recursive: Also scan the subfolders (default: False)
+
+        Returns:
+            List of ExcelFileMetadata objects, in the same order as the scanned files
+
+        Raises:
+            Same exceptions as scan_folder_for_excel_files and get_file_metadata
+        """
+        file_paths = self.scan_folder_for_excel_files(folder_path, pattern, recursive)
+        if not file_paths:
+            return []
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        chunksize = max(1, len(file_paths) // (4 * max_workers))
+        self.logger.info(
+            f"Gathering metadata for {len(file_paths)} files with {max_workers} workers"
+        )
+
+        # Every file is read with the settings of this extractor
+        extract_one = partial(
+            _extract_one_metadata,
+            engine=self.engine,
+            prefetch_local=self.prefetch_local,
+        )
+
+        # A single worker gains nothing from a pool but its start-up cost
+        if max_workers == 1:
+            metadata_dicts = [extract_one(path) for path in file_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                metadata_dicts = list(
+                    executor.map(extract_one, file_paths, chunksize=chunksize)
+                )
+        metadata_list = [
+            _construct_model(ExcelFileMetadata, metadata) for metadata in metadata_dicts
+        ]
+
+        self.logger.info(
+            f"Successfully gathered metadata for {len(metadata_list)} files"
+        )
+        return metadata_list
@@ -2,35 +2,104 @@
 Pydantic models for data validation of Excel data.
 """
 
+import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
-from enum import Enum
-from pydantic import BaseModel, Field, validator, root_validator
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Final,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+from functools import cached_property
+import numpy as np
+from typing_extensions import Annotated, TypedDict
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from utils.logging_utils import ContextLogger
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Create a logger for the data models module
 logger = ContextLogger("data_models")
 
+# Shared by all models: nested model instances are passed through as-is rather
+# than copied and revalidated, and assignments are not revalidated
+_MODEL_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    frozen=False,
+    extra="ignore",
+    str_strip_whitespace=False,
+    arbitrary_types_allowed=True,
+)
+
+
+def _weighted_sum_loop(values: np.ndarray, probabilities: np.ndarray) -> float:
+    """Sum values weighted by probability percentages, treating NaN as 100%."""
+    total = 0.0
+    for i in range(values.size):
+        probability = probabilities[i]
+        weight = 1.0 if np.isnan(probability) else probability * 0.01
+        total += values[i] * weight
+    return total
+
+
+def _weighted_sum_numpy(values: np.ndarray, probabilities: np.ndarray) -> float:
+    """Sum values weighted by probability percentages, treating NaN as 100%."""
+    weights = np.where(np.isnan(probabilities), 1.0, probabilities * 0.01)
+    return float(values @ weights)
+
 
-class ProbabilityStatus(str, Enum):
-    """Enum for probability status values."""
+# Compile the weighted sum with Numba when it is installed; the NumPy version
+# is the fallback
+if njit is not None:
+    _weighted_sum = njit(cache=True)(_weighted_sum_loop)
+else:
+    _weighted_sum = _weighted_sum_numpy
 
-    LOW = "Low"
-    MEDIUM = "Medium"
-    HIGH = "High"
-    CLOSED_WON = "Closed Won"
-    CLOSED_LOST = "Closed Lost"
+
+# Probability status values; a Literal validates with a plain membership check
+# instead of an Enum lookup and keeps statuses as ordinary strings
+ProbabilityStatusT = Literal["Low", "Medium", "High", "Closed Won", "Closed Lost"]
+
+
+class ProbabilityStatus:
+    """Names for the probability status values."""
+
+    LOW: Final = "Low"
+    MEDIUM: Final = "Medium"
+    HIGH: Final = "High"
+    CLOSED_WON: Final = "Closed Won"
+    CLOSED_LOST: Final = "Closed Lost"
 
 
 class Contact(BaseModel):
     """Model for contact information."""
 
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Contact name")
     email: Optional[str] = Field(None, description="Contact email")
     phone: Optional[str] = Field(None, description="Contact phone number")
 
-    @validator("email")
+    @field_validator("email")
+    @classmethod
     def validate_email(cls, v):
         """Validate email format if provided."""
         if v is not None and "@" not in v:
@@ -39,64 +108,101 @@ class Contact(BaseModel):
         return v
 
 
-class FunnelEntry(BaseModel):
-    """Model for a single funnel entry from the Excel file."""
+def _check_probability_range(v: float) -> float:
+    """Validate probability is between 0 and 100."""
+    if v < 0 or v > 100:
+        logger.warning(f"Invalid probability value: {v}")
+        raise ValueError("Probability must be between 0 and 100")
+    return v
+
+
+# Probability percentage; the check is a plain function attached to the type,
+# so every model using it shares one validator instead of a per-class one
+Probability = Annotated[float, AfterValidator(_check_probability_range)]
+
+
+class CompanyInfo(BaseModel):
+    """Model for the text fields identifying a funnel entry."""
+
+    model_config = _MODEL_CONFIG
 
     id: Optional[str] = Field(None, description="Unique identifier")
     company_name: str = Field(..., description="Company name")
     project_name: str = Field(..., description="Project name")
+
+
+class MetricsInfo(BaseModel):
+    """Model for the numeric fields of a funnel entry."""
+
+    model_config = _MODEL_CONFIG
+
     value: float = Field(..., description="Project value")
-    probability: Optional[float] = Field(
+    probability: Optional[Probability] = Field(
         None, description="Probability percentage (0-100)"
     )
-    status: Optional[ProbabilityStatus] = Field(None, description="Current status")
+
+
+class ScheduleInfo(BaseModel):
+    """Model for the date fields of a funnel entry."""
+
+    model_config = _MODEL_CONFIG
+
     start_date: Optional[datetime] = Field(None, description="Project start date")
     expected_close_date: Optional[datetime] = Field(
         None, description="Expected closing date"
     )
-    contacts: Optional[List[Contact]] = Field(
-        default_factory=list, description="List of contacts"
-    )
-    notes: Optional[str] = Field(None, description="Additional notes")
     last_updated: Optional[datetime] = Field(None, description="Last update timestamp")
-    custom_fields: Dict[str, Any] = Field(
-        default_factory=dict, description="Custom fields"
-    )
 
-    @validator("probability")
-    def validate_probability(cls, v):
-        """Validate probability is between 0 and 100."""
-        if v is not None and (v < 0 or v > 100):
-            logger.warning(f"Invalid probability value: {v}")
-            raise ValueError("Probability must be between 0 and 100")
-        return v
-
-    @root_validator
-    def check_dates(cls, values):
+    @model_validator(mode="after")
+    def check_dates(self):
         """Validate that start_date is before expected_close_date if both are provided."""
-        start_date = values.get("start_date")
-        close_date = values.get("expected_close_date")
+        start_date = self.start_date
+        close_date = self.expected_close_date
 
         if start_date and close_date and start_date > close_date:
-            company = values.get("company_name", "Unknown")
-            project = values.get("project_name", "Unknown")
+            company = getattr(self, "company_name", "Unknown")
+            project = getattr(self, "project_name", "Unknown")
             logger.warning(
                 f"Invalid dates for {company}/{project}: start date {start_date} is after close date {close_date}"
             )
             raise ValueError("Start date must be before expected close date")
 
-        # Log creation of valid entry
-        if "company_name" in values and "project_name" in values:
+        return self
+
+
+class FunnelEntry(ScheduleInfo, MetricsInfo, CompanyInfo):
+    """
+    Model for a single funnel entry from the Excel file.
+
+    Composed from the text, numeric and date field groups, each of which
+    carries only the validators for its own fields.
+    """
+
+    status: Optional[ProbabilityStatusT] = Field(None, description="Current status")
+    contacts: Optional[List[Contact]] = Field(
+        default_factory=list, description="List of contacts"
+    )
+    notes: Optional[str] = Field(None, description="Additional notes")
+    custom_fields: Dict[str, Any] = Field(
+        default_factory=dict, description="Custom fields"
+    )
+
+    @model_validator(mode="after")
+    def log_creation(self):
+        """Log creation of a valid entry."""
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Created FunnelEntry for {values['company_name']}/{values['project_name']}"
+                f"Created FunnelEntry for {self.company_name}/{self.project_name}"
             )
 
-        return values
+        return self
 
 
 class FunnelData(BaseModel):
     """Model for the complete funnel data set."""
 
+    model_config = _MODEL_CONFIG
+
     entries: List[FunnelEntry] = Field(..., description="List of funnel entries")
     extraction_date: datetime = Field(
         default_factory=datetime.now, description="Date when data was extracted"
@@ -105,53 +211,174 @@ class FunnelData(BaseModel):
     sheet_name: Optional[str] = Field(None, description="Excel sheet name")
     total_value: Optional[float] = Field(None, description="Sum of all entry values")
 
-    @root_validator
-    def calculate_total_value(cls, values):
-        """Calculate the total value of all entries."""
-        entries = values.get("entries", [])
-        source_file = values.get("source_file", "Unknown")
-        sheet_name = values.get("sheet_name", "Unknown")
-
-        if entries:
-            values["total_value"] = sum(entry.value for entry in entries)
+    @model_validator(mode="after")
+    def calculate_total_value(self):
+        """Calculate the total value of all entries unless it was provided."""
+        if self.total_value is None and self.entries:
+            self.total_value = float(self.values_array.sum())
             logger.info(
-                f"Calculated total value {values['total_value']} for {len(entries)} entries from {source_file}/{sheet_name}"
+                f"Calculated total value {self.total_value} for {len(self.entries)} entries from {self.source_file}/{self.sheet_name}"
             )
 
-        return values
+        return self
+
+    # Column arrays are built on first use and kept in the instance dict;
+    # entries are not reassigned after extraction, so they do not go stale
+    @cached_property
+    def values_array(self) -> np.ndarray:
+        """Entry values as a float64 array."""
+        return np.fromiter(
+            (entry.value for entry in self.entries),
+            dtype=np.float64,
+            count=len(self.entries),
+        )
+
+    @cached_property
+    def probabilities_array(self) -> np.ndarray:
+        """Entry probabilities as a float64 array, NaN where missing."""
+        return np.fromiter(
+            (
+                entry.probability if entry.probability is not None else np.nan
+                for entry in self.entries
+            ),
+            dtype=np.float64,
+            count=len(self.entries),
+        )
+
+    def weighted_pipeline(self) -> float:
+        """Sum entry values weighted by probability; entries without one count in full."""
+        return float(_weighted_sum(self.values_array, self.probabilities_array))
+
+
+class FunnelDataColumnar(BaseModel):
+    """Model for the complete funnel data set stored as one array per field."""
+
+    model_config = _MODEL_CONFIG
+
+    # Entry fields stored as columns, grouped by array dtype
+    object_columns: ClassVar[Tuple[str, ...]] = (
+        "id",
+        "company_name",
+        "project_name",
+        "status",
+        "notes",
+    )
+    float_columns: ClassVar[Tuple[str, ...]] = ("value", "probability")
+    datetime_columns: ClassVar[Tuple[str, ...]] = (
+        "start_date",
+        "expected_close_date",
+        "last_updated",
+    )
+    columns: ClassVar[Tuple[str, ...]] = (
+        object_columns + float_columns + datetime_columns
+    )
+
+    id: np.ndarray = Field(..., description="Entry IDs, None when missing")
+    company_name: np.ndarray = Field(..., description="Company names")
+    project_name: np.ndarray = Field(..., description="Project names")
+    value: np.ndarray = Field(..., description="Project values as float64")
+    probability: np.ndarray = Field(
+        ..., description="Probability percentages as float64, NaN when missing"
+    )
+    status: np.ndarray = Field(..., description="Status values, None when missing")
+    start_date: np.ndarray = Field(..., description="Start dates, NaT when missing")
+    expected_close_date: np.ndarray = Field(
+        ..., description="Expected close dates, NaT when missing"
+    )
+    last_updated: np.ndarray = Field(
+        ..., description="Last update dates, NaT when missing"
+    )
+    notes: np.ndarray = Field(..., description="Notes, None when missing")
+    custom_fields: Dict[str, np.ndarray] = Field(
+        default_factory=dict, description="Custom field columns by name"
+    )
+    extraction_date: datetime = Field(
+        default_factory=datetime.now, description="Date when data was extracted"
+    )
+    source_file: str = Field(..., description="Source Excel file path")
+    sheet_name: Optional[str] = Field(None, description="Excel sheet name")
+    total_value: Optional[float] = Field(None, description="Sum of all entry values")
+
+    @model_validator(mode="after")
+    def check_columns(self) -> "FunnelDataColumnar":
+        """Check all columns have the same length and calculate the total value."""
+        lengths = {len(getattr(self, name)) for name in self.columns}
+        lengths.update(len(column) for column in self.custom_fields.values())
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+
+        if self.total_value is None and len(self):
+            self.total_value = float(self.value.sum())
+
+        return self
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @cached_property
+    def entries(self) -> List[FunnelEntry]:
+        """Entries built from the columns on first use, for row-wise callers."""
+        # Turn every column into Python values once, with None where missing
+        columns = {name: getattr(self, name).tolist() for name in self.object_columns}
+        for name in self.float_columns:
+            columns[name] = [
+                None if value != value else value
+                for value in getattr(self, name).tolist()
+            ]
+        for name in self.datetime_columns:
+            columns[name] = getattr(self, name).astype("datetime64[us]").tolist()
+        custom_columns = {
+            name: column.tolist() for name, column in self.custom_fields.items()
+        }
+
+        entries = []
+        for i in range(len(self)):
+            record = {
+                name: column[i]
+                for name, column in columns.items()
+                if column[i] is not None
+            }
+            if custom_columns:
+                record["custom_fields"] = {
+                    name: column[i]
+                    for name, column in custom_columns.items()
+                    if column[i] is not None
+                }
+            entries.append(FunnelEntry.model_construct(**record))
+        return entries
+
+    def weighted_pipeline(self) -> float:
+        """Sum entry values weighted by probability; entries without one count in full."""
+        return float(_weighted_sum(self.value, self.probability))
 
 
 class ExcelSheetMetadata(BaseModel):
     """Model for Excel sheet metadata."""
 
+    model_config = _MODEL_CONFIG
+
     sheet_name: str = Field(..., description="Name of the sheet")
     row_count: int = Field(..., description="Number of rows")
     column_count: int = Field(..., description="Number of columns")
     column_headers: List[str] = Field(..., description="Column headers")
 
-    @validator("row_count", "column_count")
-    def validate_counts(cls, v, values, **kwargs):
+    @field_validator("row_count", "column_count")
+    @classmethod
+    def validate_counts(cls, v, info: ValidationInfo):
         """Validate counts are positive."""
         if v <= 0:
-            field_name = next(
-                name for name, value in kwargs.get("field").items() if value == v
-            )
-            sheet_name = values.get("sheet_name", "Unknown")
-            logger.warning(f"Invalid {field_name} for sheet {sheet_name}: {v}")
+            sheet_name = info.data.get("sheet_name", "Unknown")
+            logger.warning(f"Invalid {info.field_name} for sheet {sheet_name}: {v}")
             raise ValueError("Count must be positive")
 
         return v
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        logger.debug(
-            f"Created metadata for sheet {self.sheet_name}: {self.row_count} rows, {self.column_count} columns"
-        )
-
 
 class ExcelFileMetadata(BaseModel):
     """Model for Excel file metadata."""
 
+    model_config = _MODEL_CONFIG
+
     file_path: str = Field(..., description="Path to the Excel file")
     file_size: Optional[int] = Field(None, description="File size in bytes")
     last_modified: Optional[datetime] = Field(
@@ -161,8 +388,20 @@ class ExcelFileMetadata(BaseModel):
         default_factory=list, description="Metadata for each sheet"
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        logger.info(
-            f"Created metadata for file {self.file_path}: {len(self.sheets)} sheets, {self.file_size} bytes"
-        )
+
+class ExcelSheetMetadataTD(TypedDict):
+    """Plain-dict form of ExcelSheetMetadata for internal pipelines."""
+
+    sheet_name: str
+    row_count: int
+    column_count: int
+    column_headers: List[str]
+
+
+class ExcelFileMetadataTD(TypedDict):
+    """Plain-dict form of ExcelFileMetadata for internal pipelines."""
+
+    file_path: str
+    file_size: Optional[int]
+    last_modified: Optional[datetime]
+    sheets: List[ExcelSheetMetadataTD]
@@ -12,6 +12,20 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from models.data_models import FunnelEntry, FunnelData
+from utils.metadata_cache import CACHE_DIR_ENV, metadata_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_metadata_cache(tmp_path, monkeypatch):
+    """
+    Keep the metadata cache of each test in its own temporary directory.
+    """
+    cache_dir = str(tmp_path / "metadata_cache")
+    monkeypatch.setenv(CACHE_DIR_ENV, cache_dir)
+    monkeypatch.setattr(metadata_cache, "cache_dir", cache_dir)
+    metadata_cache.clear()
+    yield cache_dir
+    metadata_cache.clear()
 
 
 @pytest.fixture
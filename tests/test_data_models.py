@@ -2,6 +2,7 @@
 Unit tests for the data models used in the application.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
 from pydantic import ValidationError
@@ -10,6 +11,7 @@ from models.data_models import (
     Contact,
     FunnelEntry,
     FunnelData,
+    FunnelDataColumnar,
     ExcelSheetMetadata,
     ExcelFileMetadata,
     ProbabilityStatus,
@@ -134,6 +136,61 @@ class TestDataModels:
                 source_file="path/to/file.xlsx",
             )
 
+    def test_funnel_data_weighted_pipeline(self, sample_funnel_entries):
+        """Test the probability-weighted pipeline value of FunnelData."""
+        funnel_data = FunnelData(
+            entries=sample_funnel_entries,
+            extraction_date=datetime(2025, 4, 16),
+            source_file="path/to/file.xlsx",
+        )
+
+        # 50000 * 0.8 + 75000 * 0.5 + 100000 * 0.3
+        assert funnel_data.weighted_pipeline() == pytest.approx(107500.0)
+
+        # Entries without a probability count at full value
+        entries = sample_funnel_entries + [
+            FunnelEntry(company_name="New Co", project_name="Pilot", value=1000.0)
+        ]
+        funnel_data = FunnelData(entries=entries, source_file="path/to/file.xlsx")
+        assert funnel_data.weighted_pipeline() == pytest.approx(108500.0)
+
+    def test_funnel_data_columnar_model(self):
+        """Test the FunnelDataColumnar model."""
+        missing = np.full(2, None, dtype=object)
+        no_dates = np.full(2, np.datetime64("NaT", "ns"))
+        columns = dict(
+            id=missing,
+            company_name=np.array(["ABC Corp", "XYZ Ltd"], dtype=object),
+            project_name=np.array(["Website Redesign", "Mobile App"], dtype=object),
+            value=np.array([50000.0, 75000.0]),
+            probability=np.array([80.0, np.nan]),
+            status=np.array([ProbabilityStatus.HIGH, None], dtype=object),
+            start_date=np.array(["2025-01-01", "NaT"], dtype="datetime64[ns]"),
+            expected_close_date=no_dates,
+            last_updated=no_dates,
+            notes=missing,
+        )
+        funnel_data = FunnelDataColumnar(**columns, source_file="path/to/file.xlsx")
+
+        assert len(funnel_data) == 2
+        assert funnel_data.total_value == 125000.0
+        assert funnel_data.weighted_pipeline() == pytest.approx(115000.0)
+
+        # Entries are materialized with missing values left at their defaults
+        first, second = funnel_data.entries
+        assert isinstance(first, FunnelEntry)
+        assert first.start_date == datetime(2025, 1, 1)
+        assert first.status == ProbabilityStatus.HIGH
+        assert second.probability is None
+        assert second.start_date is None
+
+        # Columns of different lengths should raise ValidationError
+        with pytest.raises(ValidationError):
+            FunnelDataColumnar(
+                **{**columns, "value": np.array([1.0])},
+                source_file="path/to/file.xlsx",
+            )
+
     def test_excel_sheet_metadata_model(self):
         """Test the ExcelSheetMetadata model."""
         # Valid sheet metadata
@@ -3,13 +3,15 @@ Unit tests for the Excel extraction functionality.
 """
 
 import os
+import zipfile
 import pytest
 import pandas as pd
 from unittest import mock
 from datetime import datetime
 
 from core.extraction import ExcelExtractor
-from models.data_models import FunnelData, ExcelFileMetadata
+from models.data_models import FunnelData, FunnelDataColumnar, ExcelFileMetadata
+from utils.metadata_cache import metadata_cache
 
 
 class TestExcelExtractor:
@@ -39,11 +41,11 @@ class TestExcelExtractor:
         assert len(result) == len(mock_excel_data["Sheet1"])
         assert list(result.columns) == list(mock_excel_data["Sheet1"].columns)
 
-    @mock.patch("os.path.exists")
-    def test_extract_data_file_not_found(self, mock_exists):
+    @mock.patch("os.stat")
+    def test_extract_data_file_not_found(self, mock_stat):
         """Test the extract_data method when the file is not found."""
-        # Configure the mock to return False for os.path.exists
-        mock_exists.return_value = False
+        # Configure the mock to fail the stat the way a missing file does
+        mock_stat.side_effect = FileNotFoundError("nonexistent_file.xlsx")
 
         # Create an extractor with a dummy file path
         extractor = ExcelExtractor("nonexistent_file.xlsx")
@@ -52,14 +54,28 @@ class TestExcelExtractor:
         with pytest.raises(FileNotFoundError):
             extractor.extract_data()
 
-    @mock.patch("pandas.ExcelFile")
-    def test_get_sheet_names(self, mock_excel_file):
+    @mock.patch("os.stat")
+    def test_extract_data_permission_error(self, mock_stat):
+        """Test the extract_data method when the network drive is unreachable."""
+        mock_stat.side_effect = PermissionError("Access is denied")
+
+        extractor = ExcelExtractor("Z:\\FUNNEL.xlsx")
+
+        with pytest.raises(PermissionError, match="check your VPN connection"):
+            extractor.extract_data()
+
+    def test_get_sheet_names(self, tmp_path, mock_excel_data):
         """Test the get_sheet_names method."""
-        # Configure the mock to return a list of sheet names
-        mock_excel_file.return_value.sheet_names = ["Sheet1", "Sheet2", "Sheet3"]
+        # Create a workbook with several sheets
+        file_path = tmp_path / "multi_sheet.xlsx"
+        with pd.ExcelWriter(file_path) as writer:
+            for sheet_name in ["Sheet1", "Sheet2", "Sheet3"]:
+                mock_excel_data["Sheet1"].to_excel(
+                    writer, sheet_name=sheet_name, index=False
+                )
 
-        # Create an extractor with a dummy file path
-        extractor = ExcelExtractor("dummy_path.xlsx")
+        # Create an extractor with the workbook path
+        extractor = ExcelExtractor(str(file_path))
 
         # Call the method
         result = extractor.get_sheet_names()
@@ -69,6 +85,73 @@ class TestExcelExtractor:
         assert len(result) == 3
         assert result == ["Sheet1", "Sheet2", "Sheet3"]
 
+    @mock.patch("pandas.ExcelFile")
+    def test_get_sheet_names_not_a_zip(self, mock_excel_file, tmp_path):
+        """Test that get_sheet_names falls back to pandas for non-zip workbooks."""
+        # Configure the mock to return a list of sheet names
+        mock_excel_file.return_value.__enter__.return_value.sheet_names = ["Sheet1"]
+
+        # A legacy .xls file is not a zip archive
+        file_path = tmp_path / "legacy.xls"
+        file_path.write_bytes(b"not a zip archive")
+        extractor = ExcelExtractor(str(file_path))
+
+        # Call the method
+        result = extractor.get_sheet_names()
+
+        # Check the result
+        assert result == ["Sheet1"]
+        assert mock_excel_file.called
+
+    @mock.patch("pandas.ExcelFile")
+    def test_get_sheet_names_unnamed_sheet(self, mock_excel_file, tmp_path):
+        """Test that a sheet without a name leaves the names to pandas."""
+        mock_excel_file.return_value.__enter__.return_value.sheet_names = ["Sheet1"]
+
+        file_path = tmp_path / "unnamed.xlsx"
+        with zipfile.ZipFile(file_path, "w") as archive:
+            archive.writestr(
+                "xl/workbook.xml",
+                '<workbook xmlns="urn:test"><sheets><sheet/></sheets></workbook>',
+            )
+
+        assert ExcelExtractor(str(file_path)).get_sheet_names() == ["Sheet1"]
+        assert mock_excel_file.called
+
+    def test_get_sheet_names_cached(self, temp_excel_file):
+        """Test that sheet names are only read again when the file changes."""
+        extractor = ExcelExtractor(temp_excel_file)
+        assert extractor.get_sheet_names() == ["Sheet1"]
+
+        # An unchanged file is served from the cache
+        with mock.patch("core.extraction._read_workbook_sheet_names") as mock_read:
+            assert extractor.get_sheet_names() == ["Sheet1"]
+            assert not mock_read.called
+
+        # Rewriting the file changes its size and modification time
+        with pd.ExcelWriter(temp_excel_file) as writer:
+            pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="Renamed", index=False)
+            pd.DataFrame({"B": [2]}).to_excel(writer, sheet_name="Extra", index=False)
+        assert extractor.get_sheet_names() == ["Renamed", "Extra"]
+
+    def test_workbook_shared_between_reads(self, temp_excel_file):
+        """Test that one open workbook serves repeated reads until closed."""
+        with ExcelExtractor(temp_excel_file) as extractor:
+            first = extractor.extract_data(sheet_name="Sheet1")
+
+            with mock.patch("pandas.ExcelFile") as mock_excel_file:
+                second = extractor.extract_data(sheet_name="Sheet1")
+                assert extractor.get_sheet_names() == ["Sheet1"]
+                assert not mock_excel_file.called
+            pd.testing.assert_frame_equal(first, second)
+
+            # Rewriting the file opens it again
+            with pd.ExcelWriter(temp_excel_file) as writer:
+                pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="New", index=False)
+            assert list(extractor.extract_data(sheet_name="New").columns) == ["A"]
+
+        assert extractor._workbook is None
+
     def test_get_file_metadata(self, temp_excel_file, mock_excel_data):
         """Test the get_file_metadata method with an actual file."""
         # Create an extractor with the temporary file path
@@ -90,6 +173,62 @@ class TestExcelExtractor:
         assert sheet_metadata.row_count == len(mock_excel_data["Sheet1"])
         assert sheet_metadata.column_count == len(mock_excel_data["Sheet1"].columns)
 
+    def test_get_file_metadata_as_dict(self, temp_excel_file):
+        """Test getting file metadata as a plain dict."""
+        extractor = ExcelExtractor(temp_excel_file)
+
+        result = extractor.get_file_metadata(as_pydantic=False)
+
+        assert isinstance(result, dict)
+        assert result["file_path"] == temp_excel_file
+        assert result["sheets"][0]["sheet_name"] == "Sheet1"
+        assert ExcelFileMetadata.model_validate(result) == (
+            extractor.get_file_metadata()
+        )
+
+    def test_get_file_metadata_cached(self, temp_excel_file, isolated_metadata_cache):
+        """Test that metadata is served from the cache until the file changes."""
+        extractor = ExcelExtractor(temp_excel_file)
+        first = extractor.get_file_metadata()
+        assert len(os.listdir(isolated_metadata_cache)) == 1
+
+        # An unchanged file is not parsed again, even by a fresh extractor
+        with mock.patch("openpyxl.load_workbook") as mock_load:
+            cached = ExcelExtractor(temp_excel_file).get_file_metadata()
+            assert extractor.get_sheet_names() == ["Sheet1"]
+            assert not mock_load.called
+        assert cached == first
+
+        # Rewriting the file changes its modification time and misses the cache
+        with pd.ExcelWriter(temp_excel_file) as writer:
+            pd.DataFrame({"A": [1, 2]}).to_excel(writer, sheet_name="New", index=False)
+        os.utime(temp_excel_file, ns=(0, os.stat(temp_excel_file).st_mtime_ns + 1))
+        result = extractor.get_file_metadata()
+        assert [sheet.sheet_name for sheet in result.sheets] == ["New"]
+        assert result.sheets[0].row_count == 2
+
+    def test_get_file_metadata_invalid_cache_entry(
+        self, temp_excel_file, isolated_metadata_cache
+    ):
+        """Test that a truncated cache entry is dropped and the file read again."""
+        expected = ExcelExtractor(temp_excel_file).get_file_metadata()
+        (entry_name,) = os.listdir(isolated_metadata_cache)
+        entry_path = os.path.join(isolated_metadata_cache, entry_name)
+        with open(entry_path, encoding="utf-8") as f:
+            payload = f.read()
+
+        for read in ("get_sheet_names", "get_file_metadata"):
+            with open(entry_path, "w", encoding="utf-8") as f:
+                f.write(payload[: len(payload) // 2])
+            metadata_cache.clear()
+
+            result = getattr(ExcelExtractor(temp_excel_file), read)()
+            assert result == (["Sheet1"] if read == "get_sheet_names" else expected)
+
+        # The entry was rewritten by the last read
+        with open(entry_path, encoding="utf-8") as f:
+            assert f.read() == payload
+
     def test_extract_validated_data(self, temp_excel_file):
         """Test the extract_validated_data method with an actual file."""
         # Create an extractor with the temporary file path
@@ -111,6 +250,80 @@ class TestExcelExtractor:
         assert entry.project_name == "Website Redesign"
         assert entry.value == 50000.0
 
+    def test_extract_columnar_data(self, temp_excel_file, mock_excel_data):
+        """Test extracting validated data as one array per field."""
+        extractor = ExcelExtractor(temp_excel_file)
+
+        result = extractor.extract_columnar_data(sheet_name="Sheet1")
+
+        assert isinstance(result, FunnelDataColumnar)
+        assert len(result) == 3
+        assert result.total_value == 225000.0
+        assert list(result.company_name) == list(mock_excel_data["Sheet1"]["Company"])
+
+        # Materialized entries match the row-wise extraction
+        rows = extractor.extract_validated_data(sheet_name="Sheet1")
+        assert result.entries == rows.entries
+
+    @mock.patch("core.extraction._is_network_path", return_value=True)
+    def test_prefetch_local_copy(self, mock_is_network_path, temp_excel_file):
+        """Test that files on network drives are parsed from a local copy."""
+        extractor = ExcelExtractor(temp_excel_file)
+        file_stats = os.stat(temp_excel_file)
+
+        # The copy is made once and reused while the source is unchanged
+        local_path = extractor._read_path(file_stats)
+        assert local_path != temp_excel_file
+        assert extractor._read_path(file_stats) == local_path
+        with open(local_path, "rb") as copy, open(temp_excel_file, "rb") as source:
+            assert copy.read() == source.read()
+
+        # Results still refer to the original file
+        result = extractor.extract_validated_data(sheet_name="Sheet1")
+        assert result.source_file == temp_excel_file
+        assert len(result.entries) == 3
+
+        # Closing the extractor deletes its copy
+        extractor.close()
+        assert not os.path.exists(local_path)
+
+        # Prefetching can be turned off
+        extractor = ExcelExtractor(temp_excel_file, prefetch_local=False)
+        assert extractor._read_path(file_stats) == temp_excel_file
+
+    def test_extract_validated_data_full_validation(self, temp_excel_file):
+        """Test that the fully validating path gives the same entries."""
+        extractor = ExcelExtractor(temp_excel_file)
+
+        fast = extractor.extract_validated_data(sheet_name="Sheet1", validate=False)
+        validated = extractor.extract_validated_data(sheet_name="Sheet1", validate=True)
+
+        assert validated.total_value == fast.total_value == 225000.0
+        assert [e.model_dump() for e in validated.entries] == [
+            e.model_dump() for e in fast.entries
+        ]
+
+    def test_extract_validated_data_from_json(self, sample_funnel_entries):
+        """Test validating funnel entries straight from JSON."""
+        extractor = ExcelExtractor("dummy_path.xlsx")
+        data = "[" + ",".join(e.model_dump_json() for e in sample_funnel_entries) + "]"
+
+        result = extractor.extract_validated_data_from_json(data, sheet_name="Sheet1")
+
+        assert isinstance(result, FunnelData)
+        assert len(result.entries) == 3
+        assert result.source_file == "dummy_path.xlsx"
+        assert result.total_value == 225000.0
+        assert result.entries[0].company_name == "ABC Corp"
+
+        # Invalid entries are reported by their position in the array
+        with pytest.raises(ValueError, match="Entry 1: probability"):
+            extractor.extract_validated_data_from_json(
+                '[{"company_name": "A", "project_name": "B", "value": 1},'
+                ' {"company_name": "C", "project_name": "D", "value": 1,'
+                ' "probability": 150}]'
+            )
+
     def test_scan_folder_for_excel_files(self, temp_excel_files):
         """Test the scan_folder_for_excel_files method."""
         folder_path, expected_files = temp_excel_files
@@ -133,6 +346,101 @@ class TestExcelExtractor:
         for expected_file in expected_files:
             assert expected_file in result
 
+    def test_scan_folder_recursive(self, temp_excel_files):
+        """Test scanning subfolders for Excel files."""
+        folder_path, expected_files = temp_excel_files
+        subfolder = os.path.join(folder_path, "archive")
+        os.mkdir(subfolder)
+        nested_file = os.path.join(subfolder, "old_funnel.xlsx")
+        with open(nested_file, "wb") as f:
+            f.write(b"")
+
+        extractor = ExcelExtractor("dummy_path.xlsx")
+
+        # Subfolders are only scanned when asked for
+        assert sorted(extractor.scan_folder_for_excel_files(folder_path)) == sorted(
+            expected_files
+        )
+        for pattern in ("*.xlsx", "sample_*.xlsx|old_*.xlsx"):
+            result = extractor.scan_folder_for_excel_files(
+                folder_path, pattern, recursive=True
+            )
+            assert sorted(result) == sorted(expected_files + [nested_file])
+
+    def test_scan_folder_overlapping_patterns(self, temp_excel_files):
+        """Test that files matched by several alternatives are listed once."""
+        folder_path, expected_files = temp_excel_files
+        extractor = ExcelExtractor("dummy_path.xlsx")
+
+        result = extractor.scan_folder_for_excel_files(
+            folder_path, "sample_funnel_0*.xlsx|*.xlsx"
+        )
+        assert len(result) == len(expected_files)
+        assert sorted(result) == sorted(expected_files)
+        assert result[0] == expected_files[0]
+
+    def test_scan_folder_dotless_name(self, temp_excel_files):
+        """Test that a file named after the extension is not matched."""
+        folder_path, expected_files = temp_excel_files
+        with open(os.path.join(folder_path, "xlsx"), "wb") as f:
+            f.write(b"")
+
+        extractor = ExcelExtractor("dummy_path.xlsx")
+        result = extractor.scan_folder_for_excel_files(folder_path, "*.xlsx")
+        assert sorted(result) == sorted(expected_files)
+
+    def test_scan_folder_case_insensitive(self, temp_excel_files):
+        """Test that suffixes match case-insensitively where paths do."""
+        folder_path, expected_files = temp_excel_files
+        extractor = ExcelExtractor("dummy_path.xlsx")
+
+        # Simulate Windows, where glob ignores case
+        with mock.patch("os.path.normcase", str.lower):
+            result = extractor.scan_folder_for_excel_files(
+                folder_path, "*_FUNNEL_0.XLSX|*_Funnel_1.xlsx"
+            )
+            assert sorted(result) == sorted(expected_files[:2])
+
+            # Plain extensions take the set lookup instead of endswith
+            result = extractor.scan_folder_for_excel_files(
+                folder_path, "*.XLSX", recursive=True
+            )
+        assert sorted(result) == sorted(expected_files)
+
+    def test_get_metadata_for_folder(self, temp_excel_files, mock_excel_data):
+        """Test gathering metadata for every Excel file in a folder."""
+        folder_path, expected_files = temp_excel_files
+
+        # Create an extractor (the file path doesn't matter for this method)
+        extractor = ExcelExtractor("dummy_path.xlsx")
+
+        # Call the method
+        result = extractor.get_metadata_for_folder(folder_path, max_workers=2)
+
+        # Check the result
+        assert len(result) == len(expected_files)
+        assert sorted(m.file_path for m in result) == sorted(expected_files)
+        for metadata in result:
+            assert isinstance(metadata, ExcelFileMetadata)
+            assert metadata.sheets[0].row_count == len(mock_excel_data["Sheet1"])
+
+    def test_get_metadata_for_folder_settings(self, temp_excel_files):
+        """Test that the extractor settings reach the per-file readers."""
+        folder_path, expected_files = temp_excel_files
+        extractor = ExcelExtractor(
+            "dummy_path.xlsx", prefetch_local=False, engine="openpyxl"
+        )
+
+        with mock.patch(
+            "core.extraction.ExcelExtractor", wraps=ExcelExtractor
+        ) as mock_extractor:
+            result = extractor.get_metadata_for_folder(folder_path, max_workers=1)
+
+        assert len(result) == len(expected_files)
+        for call in mock_extractor.call_args_list:
+            assert call.kwargs == {"prefetch_local": False, "engine": "openpyxl"}
+        assert mock_extractor.call_count == len(expected_files)
+
     @mock.patch("os.path.exists")
     def test_scan_folder_not_found(self, mock_exists):
         """Test the scan_folder_for_excel_files method when the folder is not found."""
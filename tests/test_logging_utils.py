@@ -0,0 +1,144 @@
+"""
+Unit tests for the logging utilities.
+"""
+
+import logging
+from unittest import mock
+
+import pytest
+
+from utils import logging_utils
+from utils.logging_utils import ContextFormatter, ContextLogger, setup_logging
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """
+    Log to a temporary file, restoring the default configuration afterwards.
+    """
+    path = tmp_path / "logs" / "weekly_analytics.log"
+    setup_logging(log_file=str(path))
+    yield path
+    setup_logging()
+
+
+def _make_record(msg: str = "message", created: float = 1700000000.5):
+    record = logging.LogRecord(
+        "weekly_analytics.test", logging.INFO, __file__, 1, msg, None, None
+    )
+    record.created = created
+    record.msecs = 500.0
+    return record
+
+
+class TestContextFormatter:
+    """Test suite for the ContextFormatter class."""
+
+    def test_format(self):
+        """Test that records format like they do with logging.Formatter."""
+        log_format = "%(asctime)s - %(levelname)s - %(message)s"
+        record = _make_record()
+
+        assert ContextFormatter(log_format).format(record) == (
+            logging.Formatter(log_format).format(record)
+        )
+
+    @pytest.mark.parametrize("datefmt", [None, "%H:%M:%S"])
+    def test_format_time_cache(self, datefmt):
+        """Test that cached timestamps match those of logging.Formatter."""
+        formatter = ContextFormatter()
+        expected = logging.Formatter()
+
+        # Records within one second share the cached strftime result
+        for created in (1700000000.1, 1700000000.9, 1700000001.2):
+            record = _make_record(created=created)
+            record.msecs = (created % 1) * 1000
+            assert formatter.formatTime(record, datefmt) == (
+                expected.formatTime(record, datefmt)
+            )
+
+
+class TestContextLogger:
+    """Test suite for the ContextLogger class."""
+
+    def test_context_in_message(self, caplog):
+        """Test that handlers outside setup_logging see the context."""
+        context_logger = ContextLogger("test", {"file": "funnel.xlsx"})
+        context_logger.add_context(sheet="100%")
+
+        with caplog.at_level(logging.INFO, logger="weekly_analytics"):
+            context_logger.info("Read %d rows", 3)
+            context_logger.info("Done")
+            ContextLogger("test").info("No context")
+
+        assert caplog.messages == [
+            "Read 3 rows [Context: file=funnel.xlsx | sheet=100%]",
+            "Done [Context: file=funnel.xlsx | sheet=100%]",
+            "No context",
+        ]
+        assert caplog.records[0].context == "file=funnel.xlsx | sheet=100%"
+
+    def test_level_guard(self):
+        """Test that disabled levels return before reaching the logger."""
+        context_logger = ContextLogger("test", {"a": 1})
+
+        with mock.patch.object(context_logger.logger, "log") as mock_log:
+            context_logger.debug("Not logged at INFO")
+            assert not mock_log.called
+
+            context_logger.info("Logged")
+            mock_log.assert_called_once_with(
+                logging.INFO, "Logged [Context: a=1]", extra={"context": "a=1"}
+            )
+
+    def test_extra_merged(self, caplog):
+        """Test that a caller's extra is kept alongside the context."""
+        context_logger = ContextLogger("test", {"a": 1})
+
+        with caplog.at_level(logging.INFO, logger="weekly_analytics"):
+            context_logger.info("Message", extra={"row": 7})
+
+        assert caplog.records[0].row == 7
+        assert caplog.records[0].context == "a=1"
+
+    def test_exception(self, caplog):
+        """Test that exception() logs the active exception."""
+        context_logger = ContextLogger("test")
+
+        with caplog.at_level(logging.INFO, logger="weekly_analytics"):
+            try:
+                raise ValueError("bad value")
+            except ValueError:
+                context_logger.exception("Failed")
+
+        record = caplog.records[0]
+        assert record.levelno == logging.ERROR
+        assert record.exc_info[0] is ValueError
+
+
+class TestLogFile:
+    """Test suite for logging to a file through the queue listener."""
+
+    def test_written_at_stop(self, log_file):
+        """Test that queued records are flushed when the listener stops."""
+        ContextLogger("test", {"a": 1}).info("To the file")
+        logging_utils._stop_file_listener()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 1
+        # The context is added once, not again by the file formatter
+        assert lines[0].endswith(" - To the file [Context: a=1]")
+
+    def test_later_handlers_keep_record(self, log_file, caplog):
+        """Test that queueing a record leaves it intact for later handlers."""
+        with caplog.at_level(logging.INFO, logger="weekly_analytics"):
+            try:
+                raise ValueError("bad value")
+            except ValueError:
+                ContextLogger("test").exception("Failed %s", "step")
+        logging_utils._stop_file_listener()
+
+        record = caplog.records[0]
+        assert record.args == ("step",)
+        assert record.exc_info[0] is ValueError
+        assert "ValueError: bad value" in log_file.read_text()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the metadata cache.
+"""
+
+import os
+from unittest import mock
+
+from utils.metadata_cache import CACHE_DIR_ENV, MetadataCache, cache_key
+
+
+class TestMetadataCache:
+    """Test suite for the MetadataCache class."""
+
+    def test_cache_key(self, tmp_path):
+        """Test that the key changes with the file version."""
+        file_path = tmp_path / "funnel.xlsx"
+        file_path.write_bytes(b"data")
+        file_stats = os.stat(file_path)
+
+        key = cache_key(str(file_path), file_stats)
+        assert key == cache_key(str(file_path), file_stats)
+
+        os.utime(file_path, ns=(0, file_stats.st_mtime_ns + 1))
+        assert cache_key(str(file_path), os.stat(file_path)) != key
+
+    def test_disk_layer(self, tmp_path):
+        """Test that payloads are read back from disk by a new cache."""
+        cache_dir = str(tmp_path / "cache")
+        MetadataCache(cache_dir).put("key", '{"a": 1}')
+
+        cache = MetadataCache(cache_dir)
+        assert cache.get("key") == '{"a": 1}'
+        assert cache.get("missing") is None
+        assert os.listdir(cache_dir) == ["key.json"]
+
+        # Discarding drops the payload from both layers
+        cache.discard("key")
+        assert cache.get("key") is None
+        assert os.listdir(cache_dir) == []
+
+    def test_disk_layer_opt_in(self, monkeypatch, tmp_path):
+        """Test that only the environment variable enables the disk layer."""
+        monkeypatch.delenv(CACHE_DIR_ENV)
+        assert MetadataCache().cache_dir is None
+
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        assert MetadataCache().cache_dir == str(tmp_path)
+
+    def test_disk_layer_disabled(self, monkeypatch):
+        """Test that an empty environment variable keeps the cache in memory."""
+        monkeypatch.setenv(CACHE_DIR_ENV, "")
+        cache = MetadataCache()
+        assert cache.cache_dir is None
+
+        with mock.patch("tempfile.mkstemp") as mock_mkstemp:
+            cache.put("key", "payload")
+            assert not mock_mkstemp.called
+        assert cache.get("key") == "payload"
+
+    def test_lru_eviction(self):
+        """Test that the least recently used payload is evicted first."""
+        cache = MetadataCache("", max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("a") == "1"
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_write_failure(self, tmp_path):
+        """Test that a failed write is ignored and leaves no temporary file."""
+        cache_dir = str(tmp_path / "cache")
+        cache = MetadataCache(cache_dir)
+
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            cache.put("key", "payload")
+
+        # The payload is still served from memory
+        assert cache.get("key") == "payload"
+        assert os.listdir(cache_dir) == []
@@ -5,11 +5,17 @@ This module provides a configurable logging system with context information
 that can be used throughout the application.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 # Configure the base logger
 logger = logging.getLogger("weekly_analytics")
@@ -21,6 +27,66 @@ DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(module)s - %(message)s"
 DEFAULT_LOG_LEVEL = logging.INFO
 
 
+class ContextFormatter(logging.Formatter):
+    """
+    Formatter for the handlers installed by setup_logging.
+
+    Timestamps are formatted once per second rather than once per record.
+    """
+
+    # (second, date format, formatted time) of the last formatted timestamp
+    _time_cache: Tuple[Optional[int], Optional[str], str] = (None, None, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Format the record time, reusing the strftime result within a second."""
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if cached_second != second or cached_datefmt != datefmt:
+            formatted = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            # A single tuple assignment keeps the cache consistent across threads
+            self._time_cache = (second, datefmt, formatted)
+
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class _CopyingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves the original record untouched.
+
+    Releases of Python before the bpo-35726 fix clear the args and exc_info of
+    the record in place while preparing it, so handlers run after this one,
+    such as those of the root logger, would lose the traceback. Copying here
+    does not depend on the Python release.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> Any:
+        """Prepare a copy of the record for the queue."""
+        return super().prepare(copy.copy(record))
+
+
+# Listener writing the log file from a background thread, if one is running
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and stop its listener thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
+
 def setup_logging(
     log_level: Union[int, str] = DEFAULT_LOG_LEVEL,
     log_format: str = DEFAULT_LOG_FORMAT,
@@ -32,7 +98,8 @@ def setup_logging(
     Args:
         log_level: Logging level (default: INFO)
         log_format: Log format string (default: includes timestamp, level, module, message)
-        log_file: Optional path to log file. If provided, logs will be written to this file.
+        log_file: Optional path to log file. If provided, logs will be written to this file
+            from a background thread, so logging calls do not wait on disk writes.
     """
     # Convert string log level to int if needed
     if isinstance(log_level, str):
@@ -44,9 +111,10 @@ def setup_logging(
     # Remove existing handlers to avoid duplicate logs
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    _stop_file_listener()
 
     # Create formatter
-    formatter = logging.Formatter(log_format)
+    formatter = ContextFormatter(log_format)
 
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -59,7 +127,18 @@ def setup_logging(
         os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # Records are only queued on the logging thread; the listener writes them
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _CopyingQueueHandler(log_queue)
+        queue_handler.setFormatter(ContextFormatter("%(message)s"))
+        logger.addHandler(queue_handler)
+
+        global _file_listener
+        _file_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
 
 
 def get_logger(name: str = None) -> logging.Logger:
@@ -95,6 +174,8 @@ class ContextLogger:
         """
         self.logger = get_logger(name)
         self.context = context or {}
+        self._lock = threading.Lock()
+        self._update_context_str()
 
     def add_context(self, **kwargs) -> None:
         """
@@ -103,39 +184,66 @@ class ContextLogger:
         Args:
             **kwargs: Key-value pairs to add to the context
         """
-        self.context.update(kwargs)
-
-    def _format_message(self, msg: str) -> str:
-        """Format message with context information."""
-        if not self.context:
-            return msg
-
-        context_str = " | ".join(f"{k}={v}" for k, v in self.context.items())
-        return f"{msg} [Context: {context_str}]"
+        with self._lock:
+            self.context.update(kwargs)
+            self._update_context_str()
+
+    def _update_context_str(self) -> None:
+        """Join the context once per change instead of once per message."""
+        self._context_str = " | ".join(f"{k}={v}" for k, v in self.context.items())
+        self._extra = {"context": self._context_str}
+
+        # Message suffix, also escaped for messages formatted with % args
+        suffix = f" [Context: {self._context_str}]" if self._context_str else ""
+        self._suffixes = (suffix, suffix.replace("%", "%%"))
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of the given level would be logged."""
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, msg: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Log a message with context, doing nothing when the level is disabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # The context goes into the message itself, so every handler shows it,
+        # not only those using ContextFormatter
+        plain, escaped = self._suffixes
+        if plain:
+            msg = f"{msg}{escaped if args else plain}"
+
+        extra = kwargs.pop("extra", None)
+        self.logger.log(
+            level,
+            msg,
+            *args,
+            extra={**extra, **self._extra} if extra else self._extra,
+            **kwargs,
+        )
 
     def debug(self, msg: str, *args, **kwargs) -> None:
         """Log a debug message with context."""
-        self.logger.debug(self._format_message(msg), *args, **kwargs)
+        self._log(logging.DEBUG, msg, args, kwargs)
 
     def info(self, msg: str, *args, **kwargs) -> None:
         """Log an info message with context."""
-        self.logger.info(self._format_message(msg), *args, **kwargs)
+        self._log(logging.INFO, msg, args, kwargs)
 
     def warning(self, msg: str, *args, **kwargs) -> None:
         """Log a warning message with context."""
-        self.logger.warning(self._format_message(msg), *args, **kwargs)
+        self._log(logging.WARNING, msg, args, kwargs)
 
     def error(self, msg: str, *args, **kwargs) -> None:
         """Log an error message with context."""
-        self.logger.error(self._format_message(msg), *args, **kwargs)
+        self._log(logging.ERROR, msg, args, kwargs)
 
     def critical(self, msg: str, *args, **kwargs) -> None:
         """Log a critical message with context."""
-        self.logger.critical(self._format_message(msg), *args, **kwargs)
+        self._log(logging.CRITICAL, msg, args, kwargs)
 
-    def exception(self, msg: str, *args, **kwargs) -> None:
+    def exception(self, msg: str, *args, exc_info=True, **kwargs) -> None:
         """Log an exception message with context."""
-        self.logger.exception(self._format_message(msg), *args, **kwargs)
+        self._log(logging.ERROR, msg, args, dict(kwargs, exc_info=exc_info))
 
 
 # Initialize logging with default configuration
@@ -0,0 +1,173 @@
+"""
+Metadata cache for the weekly-analytics project.
+
+This module caches serialized workbook metadata keyed by the version of the
+file it was read from, so unchanged workbooks are not parsed again. Entries
+live in memory and, when a cache directory is configured, as JSON files on
+disk so they survive between runs.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from utils.logging_utils import ContextLogger
+
+logger = ContextLogger("metadata_cache")
+
+# Environment variable enabling the on-disk layer in the given directory
+CACHE_DIR_ENV = "WEEKLY_ANALYTICS_METADATA_CACHE"
+
+# Version of the cached payload layout; bump it when the metadata schema
+# changes so entries written by older code are never read back
+SCHEMA_VERSION = 1
+
+
+def cache_key(file_path: str, file_stats: os.stat_result) -> str:
+    """
+    Build the cache key for one version of a file.
+
+    Args:
+        file_path: Path to the file
+        file_stats: Result of os.stat for the file
+
+    Returns:
+        SHA-256 hex digest of the schema version, absolute path, modification
+        time and size
+    """
+    version = (
+        f"{SCHEMA_VERSION}|{os.path.abspath(file_path)}"
+        f"|{file_stats.st_mtime_ns}|{file_stats.st_size}"
+    )
+    return hashlib.sha256(version.encode()).hexdigest()
+
+
+class MetadataCache:
+    """
+    Two-level cache of JSON payloads: an in-memory LRU backed by a directory.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the on-disk layer. Defaults to the
+                WEEKLY_ANALYTICS_METADATA_CACHE environment variable. When
+                neither is set, or the value is empty, the cache is kept in
+                memory only. Files on disk are never evicted, so the
+                directory grows with every new version of a file.
+            max_entries: Number of payloads kept in memory
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get(CACHE_DIR_ENV)
+        self.cache_dir = cache_dir or None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_path(cache_dir: str, key: str) -> str:
+        return os.path.join(cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a payload.
+
+        Args:
+            key: Key from cache_key
+
+        Returns:
+            The cached payload, or None on a miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                return payload
+
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return None
+
+        try:
+            with open(self._entry_path(cache_dir, key), encoding="utf-8") as f:
+                payload = f.read()
+        except OSError:
+            return None
+
+        self._remember(key, payload)
+        return payload
+
+    def put(self, key: str, payload: str) -> None:
+        """
+        Store a payload.
+
+        Failing to write the on-disk layer is logged and otherwise ignored;
+        the payload is still kept in memory.
+
+        Args:
+            key: Key from cache_key
+            payload: JSON text to store
+        """
+        self._remember(key, payload)
+
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return
+
+        temp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see partial JSON
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(temp_path, self._entry_path(cache_dir, key))
+        except OSError as e:
+            logger.warning(f"Could not write metadata cache entry: {str(e)}")
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def discard(self, key: str) -> None:
+        """
+        Drop a payload from memory and disk, e.g. one that failed to parse.
+
+        Args:
+            key: Key from cache_key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return
+
+        try:
+            os.remove(self._entry_path(cache_dir, key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Drop the in-memory entries. Files on disk are left in place.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Shared cache used by the extractors
+metadata_cache = MetadataCache()